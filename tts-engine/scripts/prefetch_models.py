@@ -34,6 +34,7 @@ def main() -> int:
     args = parser.parse_args()
 
     from tts_engine.model_store import (
+        DOWNLOAD_ALLOW_PATTERNS,
         KYUTAI_POCKET_MODEL_REPO,
         QWEN_BASE_MODEL_REPO,
         QWEN_CUSTOM_MODEL_REPO,
@@ -62,7 +63,11 @@ def main() -> int:
     print(f"prefetch_count={len(repos)}", flush=True)
     for repo_id in repos:
         print(f"downloading={repo_id}", flush=True)
-        local_dir = download_repo_to_local_dir(repo_id, data_dir=data_dir)
+        local_dir = download_repo_to_local_dir(
+            repo_id,
+            data_dir=data_dir,
+            allow_patterns=DOWNLOAD_ALLOW_PATTERNS,
+        )
         print(f"saved_to={local_dir}", flush=True)
 
     print("PREFETCH_MODELS_OK", flush=True)
@@ -6,10 +6,13 @@ import binascii
 from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
+import struct
 import time
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, FastAPI, Request, WebSocket
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 from starlette.websockets import WebSocketDisconnect, WebSocketState
 
 from .auth import verify_http_request, verify_websocket
@@ -18,24 +21,27 @@ from .constants import DEFAULT_VOICE_ID
 from .errors import EngineError, install_exception_handlers
 from .jobs import JobManager, TERMINAL_EVENT_TYPES
 from .model_store import (
+    DOWNLOAD_ALLOW_PATTERNS,
     KYUTAI_POCKET_MODEL_REPO,
     QWEN_BASE_MODEL_REPO,
     QWEN_CUSTOM_MODEL_REPO,
     configure_hf_cache,
     download_repo_to_local_dir,
+    get_cache_paths,
 )
 from .schemas import (
+    ACTIVATE_MODEL_REQUEST_ADAPTER,
     ActivateModelRequest,
     ActivateModelResponse,
-    CancelRequest,
+    CANCEL_REQUEST_ADAPTER,
+    CLONE_VOICE_REQUEST_ADAPTER,
     CancelResponse,
-    CloneVoiceRequest,
     CloneVoiceResponse,
     HealthCapabilities,
     HealthResponse,
     ListVoicesResponse,
     RuntimeStatus,
-    SpeakRequest,
+    SPEAK_REQUEST_ADAPTER,
     SpeakResponse,
     PrefetchModelsRequest,
     PrefetchModelsResponse,
@@ -43,6 +49,7 @@ from .schemas import (
     UpdatePlaybackResponse,
     VoiceSummary,
     UpdateVoiceRequest,
+    WARMUP_REQUEST_ADAPTER,
     WarmupRequest,
     WarmupResponse,
     WarmupStatus,
@@ -51,8 +58,16 @@ from .synth import create_synthesizer
 from .voices import VoiceStore
 
 
+# Repos prefetched in parallel; capped so concurrent snapshot_download calls
+# (each already multi-connection) do not trip Hub rate limits.
+_PREFETCH_MAX_CONCURRENCY = 3
+
+
 def create_app(config: EngineConfig) -> FastAPI:
     engine_config = config
+    # Point the HF cache at the engine data dir exactly once; request handlers
+    # read the resolved paths back via get_cache_paths().
+    configure_hf_cache(engine_config.data_dir)
     app = FastAPI(title="VoiceReader Engine", version=engine_config.engine_version)
     install_exception_handlers(app)
 
@@ -127,6 +142,10 @@ def create_app(config: EngineConfig) -> FastAPI:
             app.state.warmup_task = None
 
     async def trigger_warmup(wait: bool, force: bool, reason: str) -> bool:
+        # Idempotent under concurrency: this coroutine runs on the event loop
+        # with no await between checking and installing warmup_task, so
+        # overlapping requests (even force=True) join the in-flight run
+        # instead of starting another.
         current_task = app.state.warmup_task
         if current_task is not None and not current_task.done():
             if wait:
@@ -176,7 +195,8 @@ def create_app(config: EngineConfig) -> FastAPI:
         return ListVoicesResponse(voices=voice_store.list_voices())
 
     @router.post("/voices/clone", response_model=CloneVoiceResponse)
-    async def clone_voice(payload: CloneVoiceRequest) -> CloneVoiceResponse:
+    async def clone_voice(request: Request) -> CloneVoiceResponse:
+        payload = await _validate_request_body(request, CLONE_VOICE_REQUEST_ADAPTER)
         if not synthesizer.status.supports_voice_clone:
             raise EngineError(
                 code="MODEL_NOT_READY",
@@ -187,7 +207,10 @@ def create_app(config: EngineConfig) -> FastAPI:
                 status_code=409,
             )
 
-        voice = voice_store.create_voice(
+        # create_voice does a mkdir plus a meta.json write; run it off the
+        # event loop like the other blocking store/synth calls in this route.
+        voice = await asyncio.to_thread(
+            voice_store.create_voice,
             display_name=payload.display_name.strip(),
             language_hint=payload.language,
             ref_text=(payload.ref_text.strip() if payload.ref_text and payload.ref_text.strip() else None),
@@ -279,7 +302,9 @@ def create_app(config: EngineConfig) -> FastAPI:
         return updated
 
     @router.post("/speak", response_model=SpeakResponse)
-    async def speak(payload: SpeakRequest, request: Request) -> SpeakResponse:
+    async def speak(request: Request) -> SpeakResponse:
+        payload = await _validate_request_body(request, SPEAK_REQUEST_ADAPTER)
+
         async with runtime_lock:
             text = payload.text.strip()
             if not text:
@@ -317,7 +342,8 @@ def create_app(config: EngineConfig) -> FastAPI:
             return SpeakResponse(job_id=job.job_id, ws_url=ws_url)
 
     @router.post("/cancel", response_model=CancelResponse)
-    async def cancel(payload: CancelRequest) -> CancelResponse:
+    async def cancel(request: Request) -> CancelResponse:
+        payload = await _validate_request_body(request, CANCEL_REQUEST_ADAPTER)
         async with runtime_lock:
             if not await jobs.cancel_job(payload.job_id):
                 raise EngineError(
@@ -325,7 +351,12 @@ def create_app(config: EngineConfig) -> FastAPI:
                     message=f"Job {payload.job_id} was not found",
                     status_code=404,
                 )
-            return CancelResponse(canceled=True)
+        # Awaited outside the runtime lock: the job task needs no lock to
+        # finish, and other routes should not stall behind the wait.
+        terminal_event = None
+        if payload.wait_terminal:
+            terminal_event = await jobs.wait_for_terminal_event(payload.job_id)
+        return CancelResponse(canceled=True, terminal_event=terminal_event)
 
     @router.post("/jobs/{job_id}/playback", response_model=UpdatePlaybackResponse)
     async def update_job_playback(job_id: UUID, payload: UpdatePlaybackRequest) -> UpdatePlaybackResponse:
@@ -345,9 +376,11 @@ def create_app(config: EngineConfig) -> FastAPI:
             return UpdatePlaybackResponse(updated=True)
 
     @router.post("/models/activate", response_model=ActivateModelResponse)
-    async def activate_model(payload: ActivateModelRequest | None = None) -> ActivateModelResponse:
+    async def activate_model(request: Request) -> ActivateModelResponse:
         nonlocal engine_config, synthesizer, runtime_model_id, voice_store, jobs
-        request_payload = payload or ActivateModelRequest()
+        request_payload = await _validate_request_body(
+            request, ACTIVATE_MODEL_REQUEST_ADAPTER, default=ActivateModelRequest()
+        )
         async with runtime_lock:
             if await jobs.has_active_job():
                 raise EngineError(
@@ -425,12 +458,23 @@ def create_app(config: EngineConfig) -> FastAPI:
     async def prefetch_models(payload: PrefetchModelsRequest | None = None) -> PrefetchModelsResponse:
         request_payload = payload or PrefetchModelsRequest()
         repos = _resolve_prefetch_repos(request_payload.mode)
-        cache_paths = configure_hf_cache(engine_config.data_dir)
+        cache_paths = get_cache_paths()
+
+        # Download repos concurrently so boot I/O costs roughly the slowest
+        # repo instead of the sum; per-repo transfers overlap TCP slow-start.
+        semaphore = asyncio.Semaphore(_PREFETCH_MAX_CONCURRENCY)
+
+        async def _fetch(repo_id: str) -> Path:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    download_repo_to_local_dir,
+                    repo_id,
+                    engine_config.data_dir,
+                    DOWNLOAD_ALLOW_PATTERNS,
+                )
 
-        saved_to: dict[str, str] = {}
-        for repo_id in repos:
-            local_dir = await asyncio.to_thread(download_repo_to_local_dir, repo_id, engine_config.data_dir)
-            saved_to[repo_id] = str(local_dir)
+        local_dirs = await asyncio.gather(*(_fetch(repo_id) for repo_id in repos))
+        saved_to = {repo_id: str(local_dir) for repo_id, local_dir in zip(repos, local_dirs)}
 
         return PrefetchModelsResponse(
             mode=request_payload.mode,
@@ -442,8 +486,10 @@ def create_app(config: EngineConfig) -> FastAPI:
         )
 
     @router.post("/warmup", response_model=WarmupResponse)
-    async def warmup(payload: WarmupRequest | None = None) -> WarmupResponse:
-        request_payload = payload or WarmupRequest()
+    async def warmup(request: Request) -> WarmupResponse:
+        request_payload = await _validate_request_body(
+            request, WARMUP_REQUEST_ADAPTER, default=WarmupRequest()
+        )
         accepted = await trigger_warmup(
             wait=request_payload.wait,
             force=request_payload.force,
@@ -467,6 +513,11 @@ def create_app(config: EngineConfig) -> FastAPI:
             await websocket.close(code=4401)
             return
 
+        # ?format=binary sends AUDIO_CHUNK payloads as binary frames (header +
+        # raw PCM) instead of base64 inside JSON: 25% smaller on the wire and
+        # no decode on the client. Control events stay JSON text frames.
+        binary_audio = websocket.query_params.get("format") == "binary"
+
         queue = None
         try:
             queue, history = await jobs.subscribe(job_id)
@@ -478,7 +529,7 @@ def create_app(config: EngineConfig) -> FastAPI:
 
         try:
             for event in history:
-                await websocket.send_json(event)
+                await _send_stream_event(websocket, event, binary_audio)
                 if event.get("type") in TERMINAL_EVENT_TYPES:
                     return
 
@@ -486,7 +537,7 @@ def create_app(config: EngineConfig) -> FastAPI:
                 event = await queue.get()
                 if event is None:
                     return
-                await websocket.send_json(event)
+                await _send_stream_event(websocket, event, binary_audio)
                 if event.get("type") in TERMINAL_EVENT_TYPES:
                     return
         except WebSocketDisconnect:
@@ -500,6 +551,38 @@ def create_app(config: EngineConfig) -> FastAPI:
     return app
 
 
+# Binary AUDIO_CHUNK frame: little-endian u32 sequence number and u32 PCM byte
+# length, followed by raw s16le PCM.
+_AUDIO_FRAME_HEADER = struct.Struct("<II")
+
+
+async def _send_stream_event(websocket: WebSocket, event: dict, binary_audio: bool) -> None:
+    if binary_audio and event.get("type") == "AUDIO_CHUNK":
+        pcm = base64.b64decode(event["audio"]["data_base64"])
+        await websocket.send_bytes(_AUDIO_FRAME_HEADER.pack(event["seq"], len(pcm)) + pcm)
+        return
+    await websocket.send_json(event)
+
+
+async def _validate_request_body(request, adapter: TypeAdapter, default: object = None) -> object:
+    """Validate a JSON request body straight through a prebuilt TypeAdapter.
+
+    Bypasses FastAPI's body binding (JSON→dict→model) in favor of
+    pydantic-core's bytes-to-model fast path. An absent or ``null`` body
+    resolves to ``default`` for routes whose payload is optional.
+    """
+    body = await request.body()
+    if default is not None and (not body or body.strip() == b"null"):
+        return default
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as exc:
+        # Strip the raw input bytes (and doc URLs) from the error entries:
+        # the INVALID_REQUEST handler serializes them into a JSONResponse,
+        # which would 500 on non-JSON-safe content.
+        raise RequestValidationError(exc.errors(include_url=False, include_input=False)) from exc
+
+
 def _new_warmup_state() -> dict[str, object]:
     return {
         "status": "not_started",
@@ -13,6 +13,8 @@ DEFAULT_QWEN_DEVICE_MAP = "cuda:0"
 DEFAULT_QWEN_DTYPE = "bfloat16"
 DEFAULT_QWEN_ATTN = "flash_attention_2"
 DEFAULT_QWEN_SPEAKER = "Ryan"
+DEFAULT_QWEN_COMPILE = True
+DEFAULT_QWEN_QUANTIZE = False
 DEFAULT_KYUTAI_MODEL_NAME = "Verylicious/pocket-tts-ungated"
 DEFAULT_KYUTAI_VOICE_PROMPT = "alba"
 DEFAULT_KYUTAI_SAMPLE_RATE = 24_000
@@ -35,6 +37,8 @@ class EngineConfig:
     qwen_dtype: str = DEFAULT_QWEN_DTYPE
     qwen_attn_implementation: str = DEFAULT_QWEN_ATTN
     qwen_default_speaker: str = DEFAULT_QWEN_SPEAKER
+    qwen_compile: bool = DEFAULT_QWEN_COMPILE
+    qwen_quantize: bool = DEFAULT_QWEN_QUANTIZE
     kyutai_model_name: str = DEFAULT_KYUTAI_MODEL_NAME
     kyutai_voice_prompt: str = DEFAULT_KYUTAI_VOICE_PROMPT
     kyutai_sample_rate: int = DEFAULT_KYUTAI_SAMPLE_RATE
@@ -4,10 +4,10 @@ import asyncio
 import base64
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+import functools
 import os
 from pathlib import Path
 import shutil
-import subprocess
 import sys
 from typing import Any
 from uuid import UUID, uuid4
@@ -19,6 +19,18 @@ from .synth import BaseSynthesizer, SynthesizedAudio
 
 
 TERMINAL_EVENT_TYPES = {"JOB_DONE", "JOB_CANCELED", "JOB_ERROR"}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_b64encode():
+    # Optional dependency: pybase64's SIMD encoder runs at a fraction of a
+    # cycle per byte versus ~15-20 for the stdlib, and every JSON-mode audio
+    # chunk pays one encode of its full PCM payload.
+    try:
+        import pybase64
+    except ImportError:
+        return base64.b64encode
+    return pybase64.b64encode
 _LIBROSA_MODULE = None
 _LIBROSA_IMPORT_ATTEMPTED = False
 _SOX_PATH = None
@@ -44,6 +56,11 @@ class JobState:
 
 
 class JobManager:
+    # Single-active-job by design: starting a job cancels the previous one,
+    # because a screen reader speaks one selection at a time. This is also why
+    # synthesis is not batched across streams — there is never more than one
+    # stream generating concurrently, so chunk-level pipelining in _run_job is
+    # the applicable form of overlap.
     def __init__(self, synthesizer: BaseSynthesizer) -> None:
         self._synthesizer = synthesizer
         self._jobs: dict[UUID, JobState] = {}
@@ -110,6 +127,21 @@ class JobManager:
                 job.volume = volume
             return True
 
+    async def wait_for_terminal_event(
+        self, job_id: UUID, timeout: float = 10.0
+    ) -> dict[str, Any] | None:
+        async with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        try:
+            await asyncio.wait_for(job.done_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if self._has_terminal_event(job):
+            return job.history[-1]
+        return None
+
     async def subscribe(
         self, job_id: UUID
     ) -> tuple[asyncio.Queue[dict[str, Any] | None], list[dict[str, Any]]]:
@@ -220,10 +252,10 @@ class JobManager:
                         job.language,
                     )
 
-                # Apply SoX/controls in the thread pool so the event loop stays
-                # responsive and SoX runs concurrently with chunk i+1 synthesis.
-                synthesized = await asyncio.to_thread(
-                    _apply_playback_controls,
+                # Apply SoX/controls without leaving the event loop: SoX runs as
+                # an awaited subprocess, so it overlaps chunk i+1 synthesis while
+                # the loop stays free for other jobs and subscribers.
+                synthesized = await _apply_playback_controls(
                     synthesized,
                     job.rate,
                     job.pitch,
@@ -247,7 +279,7 @@ class JobManager:
                         "format": "pcm_s16le",
                         "sample_rate": synthesized.sample_rate,
                         "channels": synthesized.channels,
-                        "data_base64": base64.b64encode(synthesized.pcm_s16le).decode("ascii"),
+                        "data_base64": _load_b64encode()(synthesized.pcm_s16le).decode("ascii"),
                     },
                     "text_range": {
                         "chunk_index": chunk.chunk_index,
@@ -258,8 +290,9 @@ class JobManager:
                 await self._publish(job, event)
                 sequence += 1
 
-                # Yield back to the event loop between chunks.
-                await asyncio.sleep(0)
+                # No explicit yield needed between chunks: awaiting the synth
+                # future and asyncio.to_thread above already suspend this task,
+                # and cancellation is checked at the top of the loop.
 
             if job.cancel_event.is_set():
                 await self._publish(
@@ -348,7 +381,7 @@ class JobManager:
         return job.history[-1].get("type") in TERMINAL_EVENT_TYPES
 
 
-def _apply_playback_controls(
+async def _apply_playback_controls(
     audio: SynthesizedAudio,
     rate: float,
     pitch: float,
@@ -364,7 +397,7 @@ def _apply_playback_controls(
 
     # Playback-speed control (rate): time-stretch to preserve perceived pitch.
     if rate != 1.0:
-        samples = _time_stretch_preserve_pitch(samples, rate=rate, sample_rate=audio.sample_rate)
+        samples = await _time_stretch_preserve_pitch(samples, rate=rate, sample_rate=audio.sample_rate)
 
     # Reserved for future model-aware pitch handling.
     _ = pitch
@@ -380,6 +413,16 @@ def _apply_playback_controls(
     )
 
 
+@functools.lru_cache(maxsize=32)
+def _build_interp_indices(src_len: int, target_len: int) -> tuple[np.ndarray, np.ndarray]:
+    # Chunk sizes repeat heavily within a job, so the (src_len, target_len) pair
+    # is a stable cache key that avoids rebuilding linspace grids per chunk.
+    positions = np.linspace(0.0, float(src_len - 1), num=target_len, dtype=np.float64)
+    int_idx = np.minimum(positions.astype(np.int64), src_len - 2).astype(np.int32)
+    frac = (positions - int_idx).astype(np.float32)
+    return int_idx, frac
+
+
 def _resample_linear(samples: np.ndarray, target_len: int) -> np.ndarray:
     if target_len <= 1:
         return np.asarray([samples[0]], dtype=np.float32)
@@ -388,12 +431,12 @@ def _resample_linear(samples: np.ndarray, target_len: int) -> np.ndarray:
     if target_len == samples.shape[0]:
         return samples
 
-    src_x = np.linspace(0.0, float(samples.shape[0] - 1), num=samples.shape[0], dtype=np.float32)
-    dst_x = np.linspace(0.0, float(samples.shape[0] - 1), num=target_len, dtype=np.float32)
-    return np.interp(dst_x, src_x, samples).astype(np.float32)
+    int_idx, frac = _build_interp_indices(samples.shape[0], target_len)
+    interpolated = samples[int_idx] * (1.0 - frac) + samples[int_idx + 1] * frac
+    return interpolated.astype(np.float32, copy=False)
 
 
-def _time_stretch_preserve_pitch(samples: np.ndarray, rate: float, sample_rate: int) -> np.ndarray:
+async def _time_stretch_preserve_pitch(samples: np.ndarray, rate: float, sample_rate: int) -> np.ndarray:
     if rate <= 0.0:
         return samples
 
@@ -401,7 +444,7 @@ def _time_stretch_preserve_pitch(samples: np.ndarray, rate: float, sample_rate:
     if samples.shape[0] <= 8:
         return _resample_linear(samples, target_len)
 
-    sox_stretched = _time_stretch_with_sox(samples, rate=rate, sample_rate=sample_rate)
+    sox_stretched = await _time_stretch_with_sox(samples, rate=rate, sample_rate=sample_rate)
     if sox_stretched is not None:
         return sox_stretched
 
@@ -411,7 +454,8 @@ def _time_stretch_preserve_pitch(samples: np.ndarray, rate: float, sample_rate:
 
     normalized = np.asarray(samples, dtype=np.float32) / 32768.0
     try:
-        stretched = librosa.effects.time_stretch(normalized, rate=rate)
+        # librosa stretch is CPU-bound; keep it off the event loop.
+        stretched = await asyncio.to_thread(librosa.effects.time_stretch, normalized, rate=rate)
     except Exception:
         return _resample_linear(samples, target_len)
 
@@ -424,7 +468,7 @@ def _time_stretch_preserve_pitch(samples: np.ndarray, rate: float, sample_rate:
     return stretched * 32768.0
 
 
-def _time_stretch_with_sox(
+async def _time_stretch_with_sox(
     samples: np.ndarray,
     rate: float,
     sample_rate: int,
@@ -470,18 +514,19 @@ def _time_stretch_with_sox(
         command.extend(["tempo", f"{factor:.6f}"])
 
     try:
-        result = subprocess.run(
-            command,
-            input=pcm_int16.tobytes(),
-            capture_output=True,
-            check=True,
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
         )
+        stdout, _ = await process.communicate(pcm_int16.tobytes())
     except Exception:
         return None
 
-    if not result.stdout:
+    if process.returncode != 0 or not stdout:
         return None
-    stretched_int16 = np.frombuffer(result.stdout, dtype=np.int16)
+    stretched_int16 = np.frombuffer(stdout, dtype=np.int16)
     if stretched_int16.size == 0:
         return None
     return stretched_int16.astype(np.float32)
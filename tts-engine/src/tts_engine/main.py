@@ -17,7 +17,6 @@ from .config import (
     load_token,
     resolve_data_dir,
 )
-from .model_store import configure_hf_cache
 
 
 def main() -> int:
@@ -58,7 +57,6 @@ def main() -> int:
 
     port = int(bootstrap.get("port", args.port))
     data_dir = resolve_data_dir(str(bootstrap.get("data_dir")) if bootstrap.get("data_dir") else args.data_dir)
-    configure_hf_cache(data_dir)
     _ensure_websocket_runtime()
 
     config = EngineConfig(
@@ -78,6 +76,8 @@ def main() -> int:
             "flash_attention_2",
         ),
         qwen_default_speaker=load_env_config_value("VOICEREADER_QWEN_SPEAKER", "Ryan"),
+        qwen_compile=load_env_bool("VOICEREADER_QWEN_COMPILE", True),
+        qwen_quantize=load_env_bool("VOICEREADER_QWEN_QUANTIZE", False),
         kyutai_model_name=load_env_config_value(
             "VOICEREADER_KYUTAI_MODEL",
             "Verylicious/pocket-tts-ungated",
@@ -90,7 +90,16 @@ def main() -> int:
     )
 
     app = create_app(config)
-    uvicorn_config = uvicorn.Config(app, host=config.host, port=config.port, log_level="info")
+    uvicorn_config = uvicorn.Config(
+        app,
+        host=config.host,
+        port=config.port,
+        log_level="warning",
+        loop=_resolve_uvicorn_loop(),
+        http=_resolve_uvicorn_http(),
+        ws=_resolve_uvicorn_ws(),
+        lifespan="on",
+    )
     server = uvicorn.Server(uvicorn_config)
     app.state.request_shutdown = lambda: _request_shutdown(server)
     server.run()
@@ -112,6 +121,28 @@ def _load_bootstrap_payload() -> dict[str, Any]:
     return parsed
 
 
+def _resolve_uvicorn_loop() -> str:
+    # uvloop is much faster on the asyncio primitives the job/stream path leans
+    # on, but has no Windows wheels; fall back to the stock loop there.
+    if importlib.util.find_spec("uvloop") is not None:
+        return "uvloop"
+    return "asyncio"
+
+
+def _resolve_uvicorn_http() -> str:
+    if importlib.util.find_spec("httptools") is not None:
+        return "httptools"
+    return "h11"
+
+
+def _resolve_uvicorn_ws() -> str:
+    # Prefer the faster websockets implementation but honor a wsproto-only
+    # environment, which _ensure_websocket_runtime explicitly allows.
+    if importlib.util.find_spec("websockets") is not None:
+        return "websockets"
+    return "wsproto"
+
+
 def _ensure_websocket_runtime() -> None:
     has_websockets = importlib.util.find_spec("websockets") is not None
     has_wsproto = importlib.util.find_spec("wsproto") is not None
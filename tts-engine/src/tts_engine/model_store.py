@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
 import os
 from pathlib import Path
+import re
+import shutil
+import time
+from typing import NamedTuple
 
 
 QWEN_CUSTOM_MODEL_REPO = "Qwen/Qwen3-TTS-12Hz-0.6B-CustomVoice"
@@ -10,41 +14,95 @@ QWEN_BASE_MODEL_REPO = "Qwen/Qwen3-TTS-12Hz-0.6B-Base"
 KYUTAI_POCKET_MODEL_REPO = "Verylicious/pocket-tts-ungated"
 
 
-@dataclass(frozen=True, slots=True)
-class CachePaths:
+class CachePaths(NamedTuple):
+    # NamedTuple over a frozen dataclass: constructs in C without the
+    # per-field object.__setattr__ dance, and stays immutable by construction.
     cache_root: Path
     hub_cache: Path
     transformers_cache: Path
 
 
+# Most recently configured paths, so later callers can read them back without
+# re-deriving from env (os.environ lookups go through a MutableMapping wrapper
+# and are slower than a plain module-global read).
+_ACTIVE_CACHE_PATHS: CachePaths | None = None
+
+
 def configure_hf_cache(data_dir: Path) -> CachePaths:
-    default_cache_root = (data_dir / "hf-cache").resolve()
-    cache_root = Path(os.getenv("VOICEREADER_HF_CACHE_DIR", str(default_cache_root))).expanduser().resolve()
-    hub_cache = Path(
-        os.getenv("VOICEREADER_HF_HUB_CACHE_DIR", str((cache_root / "hub").resolve()))
-    ).expanduser().resolve()
-    transformers_cache = Path(
-        os.getenv("VOICEREADER_TRANSFORMERS_CACHE_DIR", str((cache_root / "transformers").resolve()))
-    ).expanduser().resolve()
-
-    cache_root.mkdir(parents=True, exist_ok=True)
-    hub_cache.mkdir(parents=True, exist_ok=True)
-    transformers_cache.mkdir(parents=True, exist_ok=True)
+    global _ACTIVE_CACHE_PATHS
+    _ACTIVE_CACHE_PATHS = _configure_hf_cache_impl(str(data_dir))
+    # Env writes stay outside the memoized body: switching back to a
+    # previously seen data_dir is a cache hit, but the vars must still be
+    # repointed or snapshot_download would keep using the intervening dir.
+    _apply_hf_cache_env(_ACTIVE_CACHE_PATHS)
+    return _ACTIVE_CACHE_PATHS
+
 
+def _apply_hf_cache_env(paths: CachePaths) -> None:
     # Force process-local ownership so engine does not drift to user-global cache dirs.
-    os.environ["HF_HOME"] = str(cache_root)
-    os.environ["HF_HUB_CACHE"] = str(hub_cache)
-    os.environ["HUGGINGFACE_HUB_CACHE"] = str(hub_cache)
-    # Prefer HF_HOME-based cache routing; TRANSFORMERS_CACHE is deprecated in transformers v5.
-    os.environ.pop("TRANSFORMERS_CACHE", None)
+    os.environ["HF_HOME"] = str(paths.cache_root)
+    os.environ["HF_HUB_CACHE"] = str(paths.hub_cache)
+    os.environ["HUGGINGFACE_HUB_CACHE"] = str(paths.hub_cache)
+    # Prefer HF_HOME-based cache routing; TRANSFORMERS_CACHE is deprecated in
+    # transformers v5. Membership check first: the common absent case is a
+    # plain lookup, skipping pop's delete path (and the putenv it triggers).
+    if "TRANSFORMERS_CACHE" in os.environ:
+        del os.environ["TRANSFORMERS_CACHE"]
+    # Rust-based parallel transfer for multi-GB weight downloads. Must be set
+    # before huggingface_hub is first imported to take effect.
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+
+def get_cache_paths() -> CachePaths:
+    """Return the paths from the last configure_hf_cache call."""
+    if _ACTIVE_CACHE_PATHS is None:
+        raise RuntimeError("configure_hf_cache() has not been called yet")
+    return _ACTIVE_CACHE_PATHS
+
+
+@functools.lru_cache(maxsize=8)
+def _configure_hf_cache_impl(data_dir_str: str) -> CachePaths:
+    # Memoized per data_dir: the mkdir/realpath syscalls below are
+    # idempotent, so they run once per unique data_dir. Kept free of env
+    # mutations — those depend on which data_dir is *currently* active, not
+    # just which ones have been seen. Raw os.path string ops: markedly cheaper than the equivalent pathlib
+    # chains, and this runs on every engine boot. Only the default root and
+    # user overrides pay a realpath walk; subpaths derived from the already
+    # resolved root are joined directly.
+    # Checked inline rather than via _resolve_env_path so the default root's
+    # realpath walk is skipped entirely when an override is present — no
+    # point resolving a path that is immediately discarded.
+    cache_root_override = os.getenv("VOICEREADER_HF_CACHE_DIR", "").strip()
+    if cache_root_override:
+        cache_root = os.path.realpath(os.path.expanduser(cache_root_override))
+    else:
+        cache_root = os.path.realpath(os.path.join(data_dir_str, "hf-cache"))
+    hub_cache = _resolve_env_path("VOICEREADER_HF_HUB_CACHE_DIR", os.path.join(cache_root, "hub"))
+    transformers_cache = _resolve_env_path(
+        "VOICEREADER_TRANSFORMERS_CACHE_DIR",
+        os.path.join(cache_root, "transformers"),
+    )
+
+    os.makedirs(cache_root, exist_ok=True)
+    os.makedirs(hub_cache, exist_ok=True)
+    os.makedirs(transformers_cache, exist_ok=True)
 
     return CachePaths(
-        cache_root=cache_root,
-        hub_cache=hub_cache,
-        transformers_cache=transformers_cache,
+        cache_root=Path(cache_root),
+        hub_cache=Path(hub_cache),
+        transformers_cache=Path(transformers_cache),
     )
 
 
+def _resolve_env_path(env_name: str, resolved_default: str) -> str:
+    # Overrides may be ~-relative or point through symlinks, so they get the
+    # full expanduser+realpath pass; the pre-resolved default is used as-is.
+    override = os.getenv(env_name, "").strip()
+    if override:
+        return os.path.realpath(os.path.expanduser(override))
+    return resolved_default
+
+
 def resolve_model_source(data_dir: Path, model_ref: str) -> str:
     normalized_ref = model_ref.strip()
     if not normalized_ref:
@@ -58,28 +116,274 @@ def resolve_model_source(data_dir: Path, model_ref: str) -> str:
         return model_ref
 
     local_repo_dir = repo_id_to_local_dir(data_dir, normalized_ref)
-    if local_repo_dir.exists():
-        return str(local_repo_dir.resolve())
+    # Only fully downloaded mirrors count as local hits; a dir without the
+    # completion marker is a leftover from an interrupted download. Single
+    # os.path stat — local_repo_dir is already realpath-normalized.
+    if os.path.exists(os.path.join(str(local_repo_dir), _COMPLETE_MARKER_NAME)):
+        _materialize_weight_files(local_repo_dir)
+        _touch_lru_marker(local_repo_dir)
+        return str(local_repo_dir)
+    if os.getenv("VOICEREADER_AUTO_FETCH", "").strip() == "1":
+        return str(ensure_model_local(normalized_ref, data_dir))
     return model_ref
 
 
+# Fast path for canonical two-segment "org/name" repo ids (the common case),
+# rejecting "." / ".." traversal segments without the per-segment split pass.
+_REPO_ID_RE = re.compile(r"^(?!\.\.?/)[^/\s]+/(?!\.\.?$)[^/\s]+$")
+
+
 def repo_id_to_local_dir(data_dir: Path, repo_id: str) -> Path:
-    segments = [segment.strip() for segment in repo_id.split("/") if segment.strip()]
+    if _REPO_ID_RE.match(repo_id):
+        return Path(os.path.realpath(os.path.join(str(data_dir), "models", repo_id)))
+
+    # Slow path for unusual ids: strip, drop empties and reject traversal
+    # segments in a single pass over the split instead of three.
+    segments: list[str] = []
+    for segment in repo_id.split("/"):
+        segment = segment.strip()
+        if not segment:
+            continue
+        if segment in {".", ".."}:
+            raise ValueError(f"Invalid Hugging Face repo id: {repo_id}")
+        segments.append(segment)
     if len(segments) < 2:
         raise ValueError(f"Invalid Hugging Face repo id: {repo_id}")
-    if any(segment in {".", ".."} for segment in segments):
-        raise ValueError(f"Invalid Hugging Face repo id: {repo_id}")
-    return (data_dir / "models" / Path(*segments)).resolve()
+    return Path(os.path.realpath(os.path.join(str(data_dir), "models", *segments)))
+
+
+_DOWNLOAD_RETRY_ATTEMPTS = 3
+_DOWNLOAD_MAX_WORKERS = 8
+_COMPLETE_MARKER_NAME = ".complete"
+# Lazily bound on first download so resolve_model_source/health paths never
+# pay the huggingface_hub import (requests, urllib3, filelock, ...).
+_SNAPSHOT_DOWNLOAD = None
+# Weight/tokenizer/config artifacts the engine actually loads; skips unused
+# .bin/.onnx/.msgpack duplicates published alongside safetensors.
+DOWNLOAD_ALLOW_PATTERNS = (
+    "*.safetensors",
+    "*.json",
+    "*.model",
+    "*.txt",
+    "*.yaml",
+    "tokenizer*",
+)
+
 
+def download_repo_to_local_dir(
+    repo_id: str,
+    data_dir: Path,
+    allow_patterns: tuple[str, ...] | list[str] | None = None,
+    max_workers: int = _DOWNLOAD_MAX_WORKERS,
+) -> Path:
+    global _SNAPSHOT_DOWNLOAD
 
-def download_repo_to_local_dir(repo_id: str, data_dir: Path) -> Path:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
     # Imported lazily so engine startup doesn't require hub import overhead.
-    from huggingface_hub import snapshot_download
+    if _SNAPSHOT_DOWNLOAD is None:
+        from huggingface_hub import snapshot_download as _SNAPSHOT_DOWNLOAD
 
+    try:
+        from requests.exceptions import ConnectionError as TransientDownloadError
+    except Exception:  # pragma: no cover - requests ships with huggingface_hub
+        TransientDownloadError = ConnectionError
+
+    # Download into a staging dir and rename into place afterwards, so a kill
+    # mid-download never leaves a partial mirror at the canonical path.
     target_dir = repo_id_to_local_dir(data_dir, repo_id)
-    target_dir.mkdir(parents=True, exist_ok=True)
-    snapshot_download(
-        repo_id=repo_id,
-        local_dir=str(target_dir),
+    staging_dir = target_dir.parent / (target_dir.name + ".incoming")
+    # snapshot_download creates local_dir itself; only the parent needs to
+    # exist, which saves a mkdir round-trip on networked filesystems.
+    target_dir.parent.mkdir(parents=True, exist_ok=True)
+    for attempt in range(1, _DOWNLOAD_RETRY_ATTEMPTS + 1):
+        try:
+            _SNAPSHOT_DOWNLOAD(
+                repo_id=repo_id,
+                local_dir=str(staging_dir),
+                allow_patterns=list(allow_patterns) if allow_patterns else None,
+                max_workers=max_workers,
+            )
+            break
+        except TransientDownloadError:
+            # hf_transfer is more sensitive to transient drops than the default
+            # client; back off and retry before giving up.
+            if attempt == _DOWNLOAD_RETRY_ATTEMPTS:
+                raise
+            time.sleep(2.0**attempt)
+
+    if target_dir.exists():
+        # Stale partial mirror from a previous interrupted run.
+        shutil.rmtree(target_dir, ignore_errors=True)
+    os.replace(str(staging_dir), str(target_dir))
+    (target_dir / _COMPLETE_MARKER_NAME).touch()
+    if _weight_compression_enabled():
+        _compress_weight_files(target_dir)
+    return target_dir
+
+
+# Opt-in zstd compression of large weight shards at rest. The qwen/kyutai
+# loaders mmap raw safetensors, so compressed shards are materialized back on
+# first resolve; the win is disk footprint and cold-copy bandwidth between
+# download and first use. Off by default: FP16/INT8 tensors compress modestly,
+# so measure per model before enabling.
+_WEIGHT_COMPRESS_ENV = "VOICEREADER_COMPRESS_WEIGHTS"
+_WEIGHT_COMPRESS_MIN_BYTES = 100 * 1024**2
+# Level 3: good ratio/speed balance, 500+ MB/s decompression per core.
+_WEIGHT_COMPRESS_LEVEL = 3
+_COMPRESSED_WEIGHT_SUFFIX = ".zst"
+
+
+def _weight_compression_enabled() -> bool:
+    return os.getenv(_WEIGHT_COMPRESS_ENV, "").strip() == "1"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_zstandard():
+    # Optional dependency; compression is silently skipped without it. Cached
+    # so a missing module does not pay the failed-import path scan per call.
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def _compress_weight_files(repo_dir: Path) -> int:
+    zstandard = _load_zstandard()
+    if zstandard is None:
+        return 0
+    compressor = zstandard.ZstdCompressor(level=_WEIGHT_COMPRESS_LEVEL)
+    compressed = 0
+    for raw_path in repo_dir.rglob("*.safetensors"):
+        try:
+            if raw_path.stat().st_size < _WEIGHT_COMPRESS_MIN_BYTES:
+                continue
+        except OSError:
+            continue
+        compressed_path = raw_path.with_name(raw_path.name + _COMPRESSED_WEIGHT_SUFFIX)
+        with open(raw_path, "rb") as src, open(compressed_path, "wb") as dst:
+            compressor.copy_stream(src, dst)
+        raw_path.unlink()
+        compressed += 1
+    return compressed
+
+
+def _materialize_weight_files(repo_dir: Path) -> int:
+    zstandard = _load_zstandard()
+    if zstandard is None:
+        return 0
+    decompressor = zstandard.ZstdDecompressor()
+    materialized = 0
+    for compressed_path in repo_dir.rglob("*.safetensors" + _COMPRESSED_WEIGHT_SUFFIX):
+        raw_path = compressed_path.with_suffix("")
+        if not raw_path.exists():
+            with open(compressed_path, "rb") as src, open(raw_path, "wb") as dst:
+                decompressor.copy_stream(src, dst)
+            materialized += 1
+        compressed_path.unlink()
+    return materialized
+
+
+_LRU_MARKER_NAME = ".lru"
+DEFAULT_MODEL_CACHE_MAX_BYTES = 40 * 1024**3
+
+
+def ensure_model_local(
+    repo_id: str,
+    data_dir: Path,
+    max_cache_bytes: int | None = None,
+) -> Path:
+    """Two-tier model resolver: local mirror hot path, Hub download slow path.
+
+    Repos already mirrored under data_dir/models are returned immediately
+    (touching their LRU marker); otherwise the least-recently-used mirrors are
+    evicted until the cache fits the budget, then the repo is downloaded.
+    """
+    local_repo_dir = repo_id_to_local_dir(data_dir, repo_id)
+    if (local_repo_dir / _COMPLETE_MARKER_NAME).exists():
+        _materialize_weight_files(local_repo_dir)
+        _touch_lru_marker(local_repo_dir)
+        return local_repo_dir
+
+    if max_cache_bytes is None:
+        max_cache_bytes = _resolve_model_cache_budget()
+    _evict_lru_models(data_dir, max_cache_bytes)
+
+    target_dir = download_repo_to_local_dir(
+        repo_id,
+        data_dir,
+        allow_patterns=DOWNLOAD_ALLOW_PATTERNS,
     )
+    # The download may have compressed the weights at rest; this result is
+    # handed straight to a model loader, so restore raw shards like the warm
+    # path above does.
+    _materialize_weight_files(target_dir)
+    _touch_lru_marker(target_dir)
     return target_dir
+
+
+def _resolve_model_cache_budget() -> int:
+    raw = os.getenv("VOICEREADER_MODEL_CACHE_MAX_BYTES", "").strip()
+    if raw:
+        try:
+            return max(0, int(raw))
+        except ValueError:
+            pass
+    return DEFAULT_MODEL_CACHE_MAX_BYTES
+
+
+def _touch_lru_marker(repo_dir: Path) -> None:
+    try:
+        (repo_dir / _LRU_MARKER_NAME).touch()
+    except OSError:
+        pass
+
+
+def _evict_lru_models(data_dir: Path, max_cache_bytes: int) -> None:
+    models_root = os.path.join(str(data_dir), "models")
+    if not os.path.isdir(models_root):
+        return
+
+    # os.scandir reuses the stat data from the directory read, halving the
+    # syscall count of the equivalent iterdir + stat enumeration.
+    mirrors: list[tuple[float, int, str]] = []
+    try:
+        with os.scandir(models_root) as org_entries:
+            org_paths = [entry.path for entry in org_entries if entry.is_dir()]
+    except OSError:
+        return
+    for org_path in org_paths:
+        try:
+            with os.scandir(org_path) as repo_entries:
+                for entry in repo_entries:
+                    if not entry.is_dir():
+                        continue
+                    try:
+                        last_used = os.stat(os.path.join(entry.path, _LRU_MARKER_NAME)).st_mtime
+                    except OSError:
+                        try:
+                            last_used = entry.stat(follow_symlinks=False).st_mtime
+                        except OSError:
+                            last_used = 0.0
+                    mirrors.append((last_used, _dir_size_bytes(entry.path), entry.path))
+        except OSError:
+            continue
+
+    total_bytes = sum(size for _, size, _ in mirrors)
+    mirrors.sort(key=lambda item: item[0])
+    for _, size, repo_path in mirrors:
+        if total_bytes <= max_cache_bytes:
+            break
+        shutil.rmtree(repo_path, ignore_errors=True)
+        total_bytes -= size
+
+
+def _dir_size_bytes(root: Path | str) -> int:
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            try:
+                total += os.stat(os.path.join(dirpath, filename)).st_size
+            except OSError:
+                continue
+    return total
@@ -1,14 +1,74 @@
 from __future__ import annotations
 
 from datetime import datetime
+import re
+import sys
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 
 from .constants import DEFAULT_VOICE_ID
 
 
+__all__ = [
+    "ACTIVATE_MODEL_REQUEST_ADAPTER",
+    "ActivateModelRequest",
+    "ActivateModelResponse",
+    "CANCEL_REQUEST_ADAPTER",
+    "CLONE_VOICE_REQUEST_ADAPTER",
+    "CancelRequest",
+    "CancelResponse",
+    "ChunkingSettings",
+    "CloneOptions",
+    "CloneVoiceRequest",
+    "CloneVoiceResponse",
+    "ErrorBody",
+    "ErrorResponse",
+    "HealthCapabilities",
+    "HealthResponse",
+    "ListVoicesResponse",
+    "PrefetchModelsRequest",
+    "PrefetchModelsResponse",
+    "RefAudioInput",
+    "RuntimeStatus",
+    "SPEAK_REQUEST_ADAPTER",
+    "SpeakRequest",
+    "SpeakResponse",
+    "SpeakSettings",
+    "UpdatePlaybackRequest",
+    "UpdatePlaybackResponse",
+    "UpdateVoiceRequest",
+    "VoiceSummary",
+    "WARMUP_REQUEST_ADAPTER",
+    "WarmupRequest",
+    "WarmupResponse",
+    "WarmupStatus",
+]
+
+
+# Cloned voice ids are always canonical hyphenated uuid4 strings; a precompiled
+# match is much cheaper than the full UUID() constructor on the request path.
+_UUID_RE = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
+# Interned so the overwhelmingly common voice_id="0" case can short-circuit on
+# an identity check before paying for strip()/regex work.
+_DEFAULT_VOICE_ID_INTERNED = sys.intern(DEFAULT_VOICE_ID)
+
+# Shared config for request models on the hot path: ignore unknown fields and
+# pin the optional validation features off explicitly so the compiled
+# validators stay as lean as pydantic v2 allows.
+_REQUEST_MODEL_CONFIG = ConfigDict(
+    extra="ignore",
+    frozen=False,
+    validate_assignment=False,
+    str_strip_whitespace=False,
+    arbitrary_types_allowed=False,
+)
+
+
 class ErrorBody(BaseModel):
     code: str
     message: str
@@ -68,6 +128,8 @@ class ListVoicesResponse(BaseModel):
 
 
 class RefAudioInput(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     path: str | None = None
     wav_base64: str | None = None
 
@@ -83,6 +145,8 @@ class CloneOptions(BaseModel):
 
 
 class CloneVoiceRequest(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     display_name: str = Field(min_length=1, max_length=80)
     ref_audio: RefAudioInput
     ref_text: str | None = None
@@ -146,10 +210,14 @@ class UpdateVoiceRequest(BaseModel):
 
 
 class ChunkingSettings(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     max_chars: int = Field(default=200, ge=100, le=2000)
 
 
 class SpeakSettings(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     rate: float = Field(default=1.0, ge=0.25, le=4.0)
     pitch: float = Field(default=1.0, ge=0.5, le=2.0)
     volume: float = Field(default=1.0, ge=0.0, le=2.0)
@@ -157,6 +225,8 @@ class SpeakSettings(BaseModel):
 
 
 class SpeakRequest(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     voice_id: str = DEFAULT_VOICE_ID
     text: str
     language: str | None = None
@@ -174,15 +244,16 @@ class SpeakRequest(BaseModel):
         elif not isinstance(value, str):
             raise ValueError('voice_id must be "0" or a UUID string')
 
+        if value is _DEFAULT_VOICE_ID_INTERNED or value == DEFAULT_VOICE_ID:
+            return DEFAULT_VOICE_ID
+
         normalized = value.strip()
         if not normalized:
             return DEFAULT_VOICE_ID
         if normalized == DEFAULT_VOICE_ID:
             return normalized
-        try:
-            UUID(normalized)
-        except ValueError as exc:
-            raise ValueError('voice_id must be "0" or a UUID string') from exc
+        if not _UUID_RE.match(normalized):
+            raise ValueError('voice_id must be "0" or a UUID string')
         return normalized
 
 
@@ -192,11 +263,18 @@ class SpeakResponse(BaseModel):
 
 
 class CancelRequest(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     job_id: UUID
+    # When set, the response carries the job's terminal event (JOB_CANCELED /
+    # JOB_DONE / JOB_ERROR) once the job has actually stopped, so callers need
+    # no follow-up stream connection to confirm the cancel.
+    wait_terminal: bool = False
 
 
 class CancelResponse(BaseModel):
     canceled: bool
+    terminal_event: dict[str, Any] | None = None
 
 
 class UpdatePlaybackRequest(BaseModel):
@@ -281,3 +359,13 @@ class PrefetchModelsResponse(BaseModel):
     data_dir: str
     models_dir: str
     hf_cache_dir: str
+
+
+# Pre-built adapters for request bodies; routes validate through these
+# directly (pydantic-core's bytes-to-model path) instead of FastAPI's
+# per-request body binding, which round-trips through JSON→dict→model.
+SPEAK_REQUEST_ADAPTER = TypeAdapter(SpeakRequest)
+CANCEL_REQUEST_ADAPTER = TypeAdapter(CancelRequest)
+CLONE_VOICE_REQUEST_ADAPTER = TypeAdapter(CloneVoiceRequest)
+WARMUP_REQUEST_ADAPTER = TypeAdapter(WarmupRequest)
+ACTIVATE_MODEL_REQUEST_ADAPTER = TypeAdapter(ActivateModelRequest)
@@ -1,30 +1,79 @@
 from __future__ import annotations
 
-from array import array
 from dataclasses import dataclass
-import math
+import functools
+import importlib.util
+import inspect
+import os
 from pathlib import Path
-from typing import Any, Protocol
-from uuid import UUID
+import re
+import time
+import types
+from typing import Any, Callable, NamedTuple, Protocol
+import warnings
+
+import numpy as np
 
 from .config import EngineConfig
 from .constants import DEFAULT_VOICE_ID
 from .model_store import resolve_model_source
 
 
-_QWEN_LANGUAGE_MAP = {
-    "auto": "Auto",
-    "zh": "Chinese",
-    "en": "English",
-    "ja": "Japanese",
-    "ko": "Korean",
-    "de": "German",
-    "fr": "French",
-    "es": "Spanish",
-    "pt": "Portuguese",
-    "ru": "Russian",
-    "it": "Italian",
-}
+# Lazy module-global singletons for the heavy optional imports. numpy is a
+# hard dependency and imported at module scope; torch/yaml are only needed by
+# the real backends, and caching them here keeps create_synthesizer's auto
+# fallback cascade from re-resolving them per attempted backend.
+_TORCH = None
+_YAML = None
+
+
+def _lazy_torch():
+    global _TORCH
+    if _TORCH is None:
+        import torch
+
+        _TORCH = torch
+    return _TORCH
+
+
+def _lazy_yaml():
+    global _YAML
+    if _YAML is None:
+        import yaml
+
+        _YAML = yaml
+    return _YAML
+
+
+# Read-only view over a plain dict; includes the canonical display names as
+# identity entries so already-resolved values hit the first lookup without a
+# strip/lower pass.
+_QWEN_LANGUAGE_MAP = types.MappingProxyType(
+    {
+        "auto": "Auto",
+        "zh": "Chinese",
+        "en": "English",
+        "ja": "Japanese",
+        "ko": "Korean",
+        "de": "German",
+        "fr": "French",
+        "es": "Spanish",
+        "pt": "Portuguese",
+        "ru": "Russian",
+        "it": "Italian",
+        "Auto": "Auto",
+        "Chinese": "Chinese",
+        "English": "English",
+        "Japanese": "Japanese",
+        "Korean": "Korean",
+        "German": "German",
+        "French": "French",
+        "Spanish": "Spanish",
+        "Portuguese": "Portuguese",
+        "Russian": "Russian",
+        "Italian": "Italian",
+    }
+)
 
 _KYUTAI_LANGUAGE_ALLOWLIST = {
     "en",
@@ -40,9 +89,14 @@ _KYUTAI_LANGUAGE_ALLOWLIST = {
 }
 
 
-@dataclass(frozen=True, slots=True)
-class SynthesizedAudio:
-    pcm_s16le: bytes
+class SynthesizedAudio(NamedTuple):
+    # Built once per chunk on the streaming hot path, so NamedTuple over a
+    # frozen dataclass: C-level construction without per-field
+    # object.__setattr__. memoryview is accepted for zero-copy handoff: the
+    # job runner only reads the payload (np.frombuffer / base64), and a view
+    # keeps its backing array alive. Producers must only pass views over
+    # buffers they won't reuse.
+    pcm_s16le: bytes | memoryview
     sample_rate: int
     channels: int = 1
 
@@ -77,11 +131,69 @@ class BaseSynthesizer(Protocol):
         raise NotImplementedError
 
 
+@functools.lru_cache(maxsize=1)
+def _load_tone_kernel():
+    # Optional numba dependency, mirroring _load_pcm16_kernel: one fused
+    # sin+scale+cast loop with the compiled artifact persisted via cache=True,
+    # so repeat processes (CI runs, dev restarts) skip recompilation.
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True, fastmath=True)
+    def _tone_kernel(sample_count, phase_step, amplitude):  # pragma: no cover - requires numba
+        out = np.empty(sample_count, dtype=np.int16)
+        for idx in range(sample_count):
+            out[idx] = np.int16(amplitude * np.sin(phase_step * idx))
+        return out
+
+    return _tone_kernel
+
+
+@functools.lru_cache(maxsize=256)
+def _mock_tone_bytes(sample_count: int, sample_rate: int, frequency_hz: float, amplitude: int) -> bytes:
+    # Tone buffers are fully determined by their parameters, so repeated
+    # same-length chunks (warmup, short UI utterances, tests) reuse the same
+    # immutable bytes object across all MockSynthesizer instances.
+    phase_step = 2.0 * np.pi * frequency_hz / sample_rate
+    kernel = _load_tone_kernel()
+    if kernel is not None:
+        return kernel(sample_count, phase_step, float(amplitude)).tobytes()
+    # numpy is a hard dependency of the engine, so the fallback stays a single
+    # vectorized ufunc pass rather than a per-sample math.sin loop.
+    positions = np.arange(sample_count, dtype=np.float32)
+    return (amplitude * np.sin(phase_step * positions)).astype(np.int16).tobytes()
+
+
 class MockSynthesizer:
     """Fallback backend that produces deterministic PCM tones per text chunk."""
 
-    def __init__(self, sample_rate: int = 24_000, detail: str | None = None, fallback_active: bool = False) -> None:
+    _TONE_FREQUENCY_HZ = 220.0
+    _TONE_AMPLITUDE = int(32767 * 0.18)
+    _MAX_CHUNK_SECONDS = 1.2
+
+    def __init__(
+        self,
+        sample_rate: int = 24_000,
+        detail: str | None = None,
+        fallback_active: bool = False,
+        chunk_delay_s: float = 0.0,
+        on_start: Callable[[str], None] | None = None,
+    ) -> None:
         self._sample_rate = sample_rate
+        # Timing hooks for tests: on_start fires with the chunk text before
+        # rendering and chunk_delay_s adds fixed latency, so tests can shape
+        # synthesis timing without monkeypatching the class.
+        self.chunk_delay_s = chunk_delay_s
+        self.on_start = on_start
+        # The tone is fixed-frequency, so every chunk is a prefix of one
+        # maximum-length waveform. Render that waveform once here; per-chunk
+        # synthesis is then a zero-copy memoryview slice of it.
+        max_samples = int(self._MAX_CHUNK_SECONDS * sample_rate) + 1
+        self._tone_pcm = _mock_tone_bytes(
+            max_samples, sample_rate, self._TONE_FREQUENCY_HZ, self._TONE_AMPLITUDE
+        )
         self.status = SynthBackendStatus(
             backend="mock",
             model_loaded=True,
@@ -103,20 +215,14 @@ class MockSynthesizer:
         _ = voice_id
 
     def synthesize_chunk(self, chunk_text: str, voice_id: str, language: str | None = None) -> SynthesizedAudio:
-        duration_seconds = max(0.18, min(1.2, len(chunk_text) / 90.0))
+        if self.on_start is not None:
+            self.on_start(chunk_text)
+        if self.chunk_delay_s > 0.0:
+            time.sleep(self.chunk_delay_s)
+        duration_seconds = max(0.18, min(self._MAX_CHUNK_SECONDS, len(chunk_text) / 90.0))
         sample_count = int(duration_seconds * self._sample_rate)
-        frequency_hz = 220.0
-        amplitude = int(32767 * 0.18)
-
-        waveform = array("h")
-        for idx in range(sample_count):
-            sample = int(
-                amplitude
-                * math.sin(2.0 * math.pi * frequency_hz * (idx / self._sample_rate))
-            )
-            waveform.append(sample)
-
-        return SynthesizedAudio(pcm_s16le=waveform.tobytes(), sample_rate=self._sample_rate, channels=1)
+        pcm = memoryview(self._tone_pcm)[: sample_count * 2]
+        return SynthesizedAudio(pcm_s16le=pcm, sample_rate=self._sample_rate, channels=1)
 
     def warmup(self, text: str, language: str | None = None) -> None:
         # Lightweight no-op warmup for mock backend.
@@ -127,9 +233,12 @@ class QwenCustomVoiceSynthesizer:
     """Qwen custom-voice backend (no-clone default voice path)."""
 
     def __init__(self, config: EngineConfig) -> None:
+        # Must be set before torch first initializes CUDA: kernel modules
+        # (cuBLAS/cuDNN) then load on first use instead of up front, cutting
+        # context-creation time and idle VRAM. No-op on non-CUDA builds.
+        os.environ.setdefault("CUDA_MODULE_LOADING", "LAZY")
         try:
-            import numpy as np
-            import torch
+            torch = _lazy_torch()
             from qwen_tts import Qwen3TTSModel
         except Exception as exc:  # pragma: no cover - runtime-dependent import
             raise RuntimeError(f"Qwen dependencies are unavailable: {exc}") from exc
@@ -139,6 +248,8 @@ class QwenCustomVoiceSynthesizer:
         self._model_name = config.qwen_model_name
         self._model_source = resolve_model_source(config.data_dir, config.qwen_model_name)
         self._default_speaker = config.qwen_default_speaker
+        # Precomputed so the common no-language chunk path skips resolution.
+        self._default_resolved_language = _resolve_qwen_language(None)
 
         dtype = self._resolve_torch_dtype(config.qwen_dtype)
         device_map = config.qwen_device_map
@@ -179,6 +290,45 @@ class QwenCustomVoiceSynthesizer:
             else:  # pragma: no cover - runtime-dependent import
                 raise RuntimeError(f"Failed to load Qwen model: {exc}") from exc
 
+        # Dynamic int8 quantization of Linear weights for CPU deployments,
+        # where float32 generation is memory-bandwidth bound: quantized
+        # kernels hit x86 VNNI / ARM int8 paths at a fraction of the weight
+        # traffic. Opt-in (VOICEREADER_QWEN_QUANTIZE) because some TTS
+        # decoders lose quality near the output activations.
+        if config.qwen_quantize and device_map.strip().lower().startswith("cpu"):
+            try:
+                self._model = torch.ao.quantization.quantize_dynamic(
+                    self._model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            except Exception as exc:  # pragma: no cover - runtime-dependent
+                detail_note = f"{detail_note}; int8 quantization unavailable ({exc})"
+            else:
+                detail_note = f"{detail_note}; quantize=int8-dynamic"
+
+        # reduce-overhead mode fuses kernels and captures CUDA graphs around
+        # the forward pass; a static KV cache is required for graph capture.
+        # CUDA-only: CPU/MPS compile times outweigh the win for short chunks.
+        self._warmup_runs = 1
+        if config.qwen_compile and self._is_cuda_device_map(device_map) and torch.cuda.is_available():
+            generation_config = getattr(self._model, "generation_config", None)
+            if generation_config is not None and hasattr(generation_config, "cache_implementation"):
+                generation_config.cache_implementation = "static"
+            # Pin the inductor cache under data_dir so recompiles survive
+            # restarts; the default tmp location is lost with the container.
+            os.environ.setdefault(
+                "TORCHINDUCTOR_CACHE_DIR", str(config.data_dir / "cache" / "inductor")
+            )
+            try:
+                self._model.forward = torch.compile(
+                    self._model.forward, mode="reduce-overhead", fullgraph=False
+                )
+            except Exception as exc:  # pragma: no cover - runtime-dependent
+                detail_note = f"{detail_note}; torch.compile unavailable ({exc})"
+            else:
+                # Graph capture needs two generations before steady state.
+                self._warmup_runs = 2
+                detail_note = f"{detail_note}; compile=reduce-overhead"
+
         self.status = SynthBackendStatus(
             backend="qwen_custom_voice",
             model_loaded=True,
@@ -205,13 +355,19 @@ class QwenCustomVoiceSynthesizer:
         if voice_id != DEFAULT_VOICE_ID:
             raise RuntimeError('Qwen custom-voice backend currently supports only voice_id "0"')
 
-        resolved_language = _resolve_qwen_language(language)
+        if language is None:
+            resolved_language = self._default_resolved_language
+        else:
+            resolved_language = _resolve_qwen_language(language)
         try:
-            wavs, sample_rate = self._model.generate_custom_voice(
-                text=chunk_text,
-                language=resolved_language,
-                speaker=self._default_speaker,
-            )
+            # inference_mode drops autograd's per-op tracking and version
+            # counters, which is measurable overhead for short chunks.
+            with self._torch.inference_mode():
+                wavs, sample_rate = self._model.generate_custom_voice(
+                    text=chunk_text,
+                    language=resolved_language,
+                    speaker=self._default_speaker,
+                )
         except Exception as exc:  # pragma: no cover - runtime-dependent inference
             raise RuntimeError(f"Qwen inference failed: {exc}") from exc
 
@@ -220,10 +376,21 @@ class QwenCustomVoiceSynthesizer:
 
         wave = wavs[0]
         if hasattr(wave, "detach"):
-            wave = wave.detach().cpu().numpy()
-        wave = self._np.asarray(wave, dtype=self._np.float32).reshape(-1)
-        wave = self._np.clip(wave, -1.0, 1.0)
-        pcm = (wave * 32767.0).astype(self._np.int16).tobytes()
+            # Clamp/scale/cast on device and copy the int16 result: halves the
+            # device-to-host transfer versus shipping float32 and converting
+            # here. bfloat16 lacks mantissa near +/-1.0, so promote to float32
+            # first (a no-op for float32 tensors). Out-of-place ops: the
+            # tensor may be an inference-mode tensor, which forbids in-place
+            # mutation outside that context.
+            tensor = wave.detach().reshape(-1)
+            if tensor.dtype != self._torch.float32:
+                tensor = tensor.float()
+            tensor = tensor.clamp(-1.0, 1.0).mul(32767.0).to(self._torch.int16)
+            pcm = tensor.cpu().numpy().tobytes()
+        else:
+            # Fused conversion instead of three full-size float temporaries.
+            wave = self._np.ascontiguousarray(wave, dtype=self._np.float32).reshape(-1)
+            pcm = _f32_to_pcm16(wave, self._np)
 
         return SynthesizedAudio(
             pcm_s16le=pcm,
@@ -232,14 +399,32 @@ class QwenCustomVoiceSynthesizer:
         )
 
     def warmup(self, text: str, language: str | None = None) -> None:
-        # Run a tiny generation to trigger lazy graph/runtime allocations.
-        self.synthesize_chunk(text, voice_id=DEFAULT_VOICE_ID, language=language)
+        # Run tiny generations to trigger lazy graph/runtime allocations;
+        # two passes when compiled so CUDA graph capture completes here
+        # instead of on the first user request.
+        for _ in range(self._warmup_runs):
+            self.synthesize_chunk(text, voice_id=DEFAULT_VOICE_ID, language=language)
 
     def _resolve_torch_dtype(self, dtype: str):
         normalized = dtype.strip().lower()
+        if normalized in {"", "auto"}:
+            # Qwen TTS models are trained in bfloat16; prefer it where the
+            # device supports it, otherwise fall back to full precision.
+            if self._torch.cuda.is_available() and self._torch.cuda.is_bf16_supported():
+                return self._torch.bfloat16
+            return self._torch.float32
         if normalized == "bfloat16":
             return self._torch.bfloat16
         if normalized == "float16":
+            if self._torch.cuda.is_available() and self._torch.cuda.is_bf16_supported():
+                # float16 silently loses ~3 mantissa bits near saturation on
+                # the tanh-bounded decoder outputs; honor the choice but warn.
+                warnings.warn(
+                    "VOICEREADER_QWEN_DTYPE=float16 on a bfloat16-capable device; "
+                    "bfloat16 gives better audio quality for the same memory footprint",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
             return self._torch.float16
         if normalized == "float32":
             return self._torch.float32
@@ -256,8 +441,8 @@ class PocketTtsSynthesizer:
 
     def __init__(self, config: EngineConfig) -> None:
         try:
-            import numpy as np
-            import yaml
+            torch = _lazy_torch()
+            yaml = _lazy_yaml()
             from pocket_tts import TTSModel
         except Exception as exc:  # pragma: no cover - runtime-dependent import
             raise RuntimeError(
@@ -266,12 +451,15 @@ class PocketTtsSynthesizer:
             ) from exc
 
         self._np = np
+        self._torch = torch
         self._yaml = yaml
         self._tts_model_cls = TTSModel
         self._model_name = config.kyutai_model_name
         self._model_source = resolve_model_source(config.data_dir, config.kyutai_model_name)
         self._default_voice_prompt = config.kyutai_voice_prompt.strip() or "alba"
         self._default_sample_rate = int(config.kyutai_sample_rate)
+        # Precomputed so the common no-language chunk path skips resolution.
+        self._default_resolved_language = _resolve_kyutai_language(None)
         self._voices_dir = config.data_dir / "voices"
         self._voice_state_cache: dict[str, Any] = {}
         self._model_source_dir = self._as_existing_dir(self._model_source)
@@ -292,6 +480,10 @@ class PocketTtsSynthesizer:
             except Exception:
                 pass
 
+        # Probe the generate_audio signature once here, so per-chunk calls
+        # don't rediscover it through a cascade of TypeError-raising attempts.
+        self._generate_call = self._build_generate_call()
+
         # Resolve and cache voice prompt state once so chunk synthesis avoids repeated setup work.
         voice_prompt_source = self._resolve_voice_prompt_source(self._default_voice_prompt)
         try:
@@ -344,9 +536,9 @@ class PocketTtsSynthesizer:
             raise RuntimeError(f"Failed to build voice prompt state: {exc}") from exc
 
         if not prompt_path.exists():
-            generated_candidates = sorted(prompt_path.parent.glob("*.safetensors"))
-            if generated_candidates:
-                prompt_path = generated_candidates[0]
+            generated_candidate = _first_file_named(prompt_path.parent, ".safetensors")
+            if generated_candidate is not None:
+                prompt_path = generated_candidate
             else:
                 raise RuntimeError("Voice cloning completed but no prompt.safetensors artifact was written")
 
@@ -402,8 +594,53 @@ class PocketTtsSynthesizer:
         return state
 
     def _generate_audio(self, voice_state: Any, chunk_text: str, language: str | None) -> Any:
-        normalized_language = _resolve_kyutai_language(language)
+        if language is None:
+            normalized_language = self._default_resolved_language
+        else:
+            normalized_language = _resolve_kyutai_language(language)
+        with self._torch.inference_mode():
+            if self._generate_call is not None:
+                return self._generate_call(voice_state, chunk_text, normalized_language)
+            return self._invoke_generate_audio(voice_state, chunk_text, normalized_language)
+
+    def _build_generate_call(self):
+        generate_audio = self._model.generate_audio
+        try:
+            parameters = inspect.signature(generate_audio).parameters
+        except (TypeError, ValueError):  # pragma: no cover - C-implemented callables
+            return None
 
+        kinds = [parameter.kind for parameter in parameters.values()]
+        accepts_state = (
+            inspect.Parameter.VAR_POSITIONAL in kinds
+            or sum(
+                1
+                for kind in kinds
+                if kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+            )
+            >= 2
+        )
+        accepts_lang = "lang" in parameters or inspect.Parameter.VAR_KEYWORD in kinds
+
+        if accepts_state and accepts_lang:
+            def call(voice_state: Any, chunk_text: str, lang: str | None) -> Any:
+                if lang:
+                    return generate_audio(voice_state, chunk_text, lang=lang)
+                return generate_audio(voice_state, chunk_text)
+        elif accepts_state:
+            def call(voice_state: Any, chunk_text: str, lang: str | None) -> Any:
+                return generate_audio(voice_state, chunk_text)
+        elif accepts_lang:
+            def call(voice_state: Any, chunk_text: str, lang: str | None) -> Any:
+                if lang:
+                    return generate_audio(chunk_text, lang=lang)
+                return generate_audio(chunk_text)
+        else:
+            def call(voice_state: Any, chunk_text: str, lang: str | None) -> Any:
+                return generate_audio(chunk_text)
+        return call
+
+    def _invoke_generate_audio(self, voice_state: Any, chunk_text: str, normalized_language: str | None) -> Any:
         # Try known call signatures in order and only fall through on signature mismatch.
         if normalized_language:
             try:
@@ -435,9 +672,9 @@ class PocketTtsSynthesizer:
     def _resolve_model_config_arg(self) -> str:
         # Pocket TTS expects either a known variant id (e.g. b6369a24) or a YAML config file path.
         if self._model_source_dir is not None:
-            yaml_candidates = sorted(self._model_source_dir.glob("*.yaml"))
-            if yaml_candidates:
-                return str(yaml_candidates[0].resolve())
+            yaml_candidate = _first_file_named(self._model_source_dir, ".yaml")
+            if yaml_candidate is not None:
+                return str(yaml_candidate.resolve())
 
             generated_yaml = self._build_local_model_config(self._model_source_dir)
             if generated_yaml is not None:
@@ -467,8 +704,8 @@ class PocketTtsSynthesizer:
 
     def _build_local_model_config(self, model_dir: Path) -> Path | None:
         tokenizer_path = model_dir / "tokenizer.model"
-        weight_candidates = sorted(model_dir.glob("tts_*.safetensors"))
-        if not tokenizer_path.exists() or not weight_candidates:
+        weight_candidate = _first_file_named(model_dir, ".safetensors", prefix="tts_")
+        if not tokenizer_path.exists() or weight_candidate is None:
             return None
 
         # __module__ path to file: pocket_tts/models/tts_model.py
@@ -480,7 +717,7 @@ class PocketTtsSynthesizer:
         with default_yaml.open("r", encoding="utf-8") as handle:
             config_data = self._yaml.safe_load(handle)
 
-        weights_path = str(weight_candidates[0].resolve())
+        weights_path = str(weight_candidate.resolve())
         config_data["weights_path"] = weights_path
         config_data["weights_path_without_voice_cloning"] = weights_path
         config_data["flow_lm"]["lookup_table"]["tokenizer_path"] = str(tokenizer_path.resolve())
@@ -520,16 +757,25 @@ def create_synthesizer(config: EngineConfig) -> BaseSynthesizer:
         return QwenCustomVoiceSynthesizer(config)
 
     # Auto mode: prefer Kyutai for fast first-run read-aloud, then Qwen, then mock fallback.
+    # Cheap find_spec checks first: a mock-only deployment should not pay the
+    # multi-second, multi-hundred-MB torch import just to discover the real
+    # backends are uninstallable.
     auto_errors: list[str] = []
-    try:
-        return PocketTtsSynthesizer(config)
-    except Exception as exc:
-        auto_errors.append(f"kyutai backend: {exc}")
+    if importlib.util.find_spec("pocket_tts") is None:
+        auto_errors.append("kyutai backend: pocket_tts is not installed")
+    else:
+        try:
+            return PocketTtsSynthesizer(config)
+        except Exception as exc:
+            auto_errors.append(f"kyutai backend: {exc}")
 
-    try:
-        return QwenCustomVoiceSynthesizer(config)
-    except Exception as exc:
-        auto_errors.append(f"qwen backend: {exc}")
+    if importlib.util.find_spec("torch") is None or importlib.util.find_spec("qwen_tts") is None:
+        auto_errors.append("qwen backend: torch/qwen_tts is not installed")
+    else:
+        try:
+            return QwenCustomVoiceSynthesizer(config)
+        except Exception as exc:
+            auto_errors.append(f"qwen backend: {exc}")
 
     return MockSynthesizer(
         detail=f"Fell back from auto backends: {' | '.join(auto_errors)}",
@@ -537,17 +783,25 @@ def create_synthesizer(config: EngineConfig) -> BaseSynthesizer:
     )
 
 
+# Sessions cycle through a handful of language strings, so both resolvers are
+# memoized; a cache hit replaces the strip/lower allocations with one lookup.
+@functools.lru_cache(maxsize=64)
 def _resolve_qwen_language(language: str | None) -> str:
     if not language:
         return "Auto"
+    mapped = _QWEN_LANGUAGE_MAP.get(language)
+    if mapped is not None:
+        return mapped
     normalized = language.strip().lower()
     if not normalized:
         return "Auto"
-    if normalized in _QWEN_LANGUAGE_MAP:
-        return _QWEN_LANGUAGE_MAP[normalized]
+    mapped = _QWEN_LANGUAGE_MAP.get(normalized)
+    if mapped is not None:
+        return mapped
     return language
 
 
+@functools.lru_cache(maxsize=64)
 def _resolve_kyutai_language(language: str | None) -> str | None:
     if not language:
         return None
@@ -559,19 +813,126 @@ def _resolve_kyutai_language(language: str | None) -> str | None:
     return normalized
 
 
+def _first_file_named(directory: Path, suffix: str, prefix: str = "") -> Path | None:
+    """Lexicographically first regular file matching prefix/suffix, or None.
+
+    os.scandir reuses the stat data from the directory read, so this avoids
+    the per-entry stat that Path.glob pays on large directories.
+    """
+    best: str | None = None
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(suffix):
+                    continue
+                if prefix and not name.startswith(prefix):
+                    continue
+                if (best is None or name < best) and entry.is_file():
+                    best = name
+    except OSError:
+        return None
+    return directory / best if best is not None else None
+
+
+# Cloned voice ids are always canonical hyphenated uuid4 strings; a regex
+# match avoids the UUID() constructor and, for the common non-UUID inputs
+# ("0", voice names), the cost of raising and catching ValueError.
+_UUID_RE = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
+
 def _is_uuid_like(candidate: str) -> bool:
+    return _UUID_RE.match(candidate) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pcm16_kernel():
+    # Optional numba dependency: a single-pass clamp+scale+cast kernel reads
+    # and writes each sample exactly once, versus the two numpy passes below.
+    # Compiled lazily on first use and cached (including the None miss).
     try:
-        UUID(candidate)
-        return True
-    except ValueError:
-        return False
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _f32_to_pcm16_kernel(samples, out):  # pragma: no cover - requires numba
+        for idx in prange(samples.size):
+            value = samples[idx]
+            if value > 1.0:
+                value = 1.0
+            elif value < -1.0:
+                value = -1.0
+            out[idx] = np.int16(value * 32767.0)
+
+    return _f32_to_pcm16_kernel
+
+
+class _Int16Pool:
+    """Size-bucketed pool of reusable int16 scratch arrays.
+
+    Sustained streaming otherwise allocates a fresh int16 buffer per chunk;
+    rounding requests up to 4096-sample buckets lets consecutive chunks of
+    similar length reuse the same scratch memory. list.pop/append are atomic
+    under the GIL, so concurrent misses merely allocate an extra array.
+    """
+
+    _BUCKET_SAMPLES = 4096
+    _MAX_PER_BUCKET = 4
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, list] = {}
+
+    def get(self, sample_count: int):
+        bucket = -(-sample_count // self._BUCKET_SAMPLES) * self._BUCKET_SAMPLES
+        stack = self._buckets.get(bucket)
+        if stack:
+            return stack.pop()
+        return np.empty(bucket, dtype=np.int16)
+
+    def put(self, scratch) -> None:
+        stack = self._buckets.setdefault(scratch.shape[0], [])
+        if len(stack) < self._MAX_PER_BUCKET:
+            stack.append(scratch)
+
+
+_PCM16_POOL = _Int16Pool()
+
+
+def _f32_to_pcm16(float_audio, np_module) -> bytes:
+    """Convert clipped-range float32 samples to int16 PCM bytes.
+
+    Callers feed this through ascontiguousarray(..., dtype=float32), which is
+    a zero-copy pass-through when the model already emitted contiguous
+    float32 — the common case — so the whole conversion reads the source
+    buffer once. The in-place clip is safe because chunk audio is fresh per
+    call and never re-read by the model.
+    """
+    sample_count = float_audio.shape[0]
+    scratch = _PCM16_POOL.get(sample_count)
+    pcm = scratch[:sample_count]
+    kernel = _load_pcm16_kernel()
+    if kernel is not None:
+        kernel(float_audio, pcm)
+    else:
+        np_module.clip(float_audio, -1.0, 1.0, out=float_audio)
+        np_module.multiply(float_audio, 32767.0, out=pcm, casting="unsafe")
+    # The tobytes() copy is deliberate: the job runner pipelines synthesis of
+    # chunk i+1 while chunk i's PCM is still in post-processing, so handing out
+    # a memoryview over reused scratch would let the next chunk clobber audio
+    # in flight. One immutable copy per chunk is the floor.
+    data = pcm.tobytes()
+    _PCM16_POOL.put(scratch)
+    return data
 
 
 def _coerce_pcm16_from_generated_audio(
     generated: Any,
     np_module,
     default_sample_rate: int,
-) -> tuple[bytes, int]:
+) -> tuple[bytes | memoryview, int]:
     sample_rate = int(default_sample_rate)
     audio_payload = generated
 
@@ -605,10 +966,23 @@ def _coerce_pcm16_from_generated_audio(
 
     array_data = array_data.reshape(-1)
     if array_data.dtype.kind in {"i", "u"}:
-        pcm = np_module.clip(array_data, -32768, 32767).astype(np_module.int16)
-    else:
-        float_audio = np_module.asarray(array_data, dtype=np_module.float32)
-        float_audio = np_module.clip(float_audio, -1.0, 1.0)
-        pcm = (float_audio * 32767.0).astype(np_module.int16)
-
-    return pcm.tobytes(), int(sample_rate)
+        # int16 input is already in range by construction — skip the clip
+        # pass. Copy rather than hand out a view: the array is owned by the
+        # backend, and nothing guarantees it returns a fresh buffer per call
+        # while _run_job pre-submits the next chunk's synthesis before this
+        # chunk's PCM is consumed (same clobber hazard as the pooled float
+        # path's mandatory copy).
+        if array_data.dtype == np_module.int16 and array_data.flags["C_CONTIGUOUS"]:
+            return array_data.tobytes(), int(sample_rate)
+        # Wider ints: clip straight into the int16 output, fusing the old
+        # clip-then-astype two-pass into one. The result is freshly allocated
+        # and unpooled, so a byte view over it is a safe zero-copy handoff
+        # (unlike the pooled float path, which must copy before its scratch
+        # buffer is reused).
+        pcm = np_module.empty(array_data.shape, dtype=np_module.int16)
+        np_module.clip(array_data, -32768, 32767, out=pcm, casting="unsafe")
+        return memoryview(pcm).cast("B"), int(sample_rate)
+
+    # Fused conversion instead of three full-size float temporaries.
+    float_audio = np_module.ascontiguousarray(array_data, dtype=np_module.float32)
+    return _f32_to_pcm16(float_audio, np_module), int(sample_rate)
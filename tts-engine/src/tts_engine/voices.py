@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+import functools
 import json
+import os
 from pathlib import Path
 import shutil
 from uuid import UUID, uuid4
@@ -9,42 +11,158 @@ from uuid import UUID, uuid4
 from .constants import DEFAULT_VOICE_ID
 from .schemas import VoiceSummary
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_orjson():
+    # Optional dependency; meta files are small, but orjson still parses them
+    # several times faster than stdlib json and skips the UTF-8 decode pass.
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _loads_meta(data: bytes) -> object:
+    orjson = _load_orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_meta(payload: object) -> bytes:
+    # Compact output: meta.json is machine-read on the hot list/exists paths,
+    # so pretty-printing only inflates the bytes written and re-read.
+    orjson = _load_orjson()
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _canonical_voice_dirname(voice_id: str) -> str:
+    # UUID() both validates and canonicalizes; memoized so repeat requests for
+    # the same voice skip the parse. Invalid ids still raise ValueError
+    # (lru_cache does not cache exceptions).
+    return str(UUID(voice_id))
+
+
+# Data dirs whose layout has already been created this process; lets repeat
+# VoiceStore construction (tests, backend swaps) skip the four mkdir syscalls.
+_ENSURED_LAYOUTS: set[Path] = set()
+
 
 class VoiceStore:
     def __init__(self, data_dir: Path, active_model_id: str) -> None:
         self._data_dir = data_dir
         self._voices_dir = self._data_dir / "voices"
         self._active_model_id = active_model_id
+        # Parsed meta.json summaries keyed by path, validated against the
+        # file's (inode, mtime_ns, size) so unchanged voices skip re-parsing.
+        self._meta_cache: dict[str, tuple[tuple[int, int, int], VoiceSummary]] = {}
+        # Aggregated summaries persisted as voices/index.json and rewritten on
+        # every create/update/delete, so listing is one file read instead of a
+        # directory scan. The in-memory copy is keyed on the index file's
+        # stats like _meta_cache entries.
+        self._index_path = self._voices_dir / "index.json"
+        self._index_cache: tuple[tuple[int, int, int], list[VoiceSummary]] | None = None
+        # The built-in entry depends only on the active model id, so validate
+        # it once here instead of on every list_voices call.
+        self._default_summary = VoiceSummary(
+            voice_id=DEFAULT_VOICE_ID,
+            display_name="Default Built-in Voice",
+            created_at=_EPOCH,
+            tts_model_id=active_model_id,
+            language_hint="auto",
+        )
         self.ensure_layout()
 
     def ensure_layout(self) -> None:
+        if self._data_dir in _ENSURED_LAYOUTS:
+            return
         for folder_name in ("models", "voices", "cache", "logs"):
             (self._data_dir / folder_name).mkdir(parents=True, exist_ok=True)
+        _ENSURED_LAYOUTS.add(self._data_dir)
 
     def list_voices(self) -> list[VoiceSummary]:
-        voices: list[VoiceSummary] = [self._default_voice_summary()]
-        if not self._voices_dir.exists():
-            return voices
+        summaries = self._load_index()
+        if summaries is None:
+            # Missing or corrupt index: fall back to a full scan and rebuild
+            # it so the next listing is a single read again.
+            summaries = self._scan_voices()
+            self._write_index(summaries)
+        voices = [self._default_summary, *summaries]
+        voices.sort(key=lambda voice: voice.created_at)
+        return voices
 
-        for voice_dir in sorted(self._voices_dir.iterdir()):
-            if not voice_dir.is_dir():
+    def _scan_voices(self) -> list[VoiceSummary]:
+        # os.scandir reuses the stat data from the directory read, and the
+        # single os.stat per meta file doubles as the cache-freshness check,
+        # so an unchanged rescan does no JSON work at all.
+        try:
+            with os.scandir(self._voices_dir) as entries:
+                voice_dir_paths = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            return []
+
+        voices: list[VoiceSummary] = []
+        for voice_dir_path in voice_dir_paths:
+            meta_path = os.path.join(voice_dir_path, "meta.json")
+            try:
+                meta_stat = os.stat(meta_path)
+            except OSError:
                 continue
-            meta_path = voice_dir / "meta.json"
-            if not meta_path.exists():
+            freshness = (meta_stat.st_ino, meta_stat.st_mtime_ns, meta_stat.st_size)
+            cached = self._meta_cache.get(meta_path)
+            if cached is not None and cached[0] == freshness:
+                voices.append(cached[1])
                 continue
             try:
-                payload = json.loads(meta_path.read_text(encoding="utf-8"))
-                voices.append(VoiceSummary.model_validate(payload))
-            except (json.JSONDecodeError, OSError, ValueError):
+                payload = _loads_meta(Path(meta_path).read_bytes())
+                voice = VoiceSummary.model_validate(payload)
+            except (OSError, ValueError):
                 continue
-
-        voices.sort(key=lambda voice: voice.created_at)
+            self._meta_cache[meta_path] = (freshness, voice)
+            voices.append(voice)
         return voices
 
+    def _load_index(self) -> list[VoiceSummary] | None:
+        try:
+            index_stat = os.stat(self._index_path)
+        except OSError:
+            return None
+        freshness = (index_stat.st_ino, index_stat.st_mtime_ns, index_stat.st_size)
+        if self._index_cache is not None and self._index_cache[0] == freshness:
+            return self._index_cache[1]
+        try:
+            payload = _loads_meta(self._index_path.read_bytes())
+            summaries = [VoiceSummary.model_validate(item) for item in payload]
+        except (OSError, TypeError, ValueError):
+            return None
+        self._index_cache = (freshness, summaries)
+        return summaries
+
+    def _write_index(self, summaries: list[VoiceSummary]) -> None:
+        payload = [voice.model_dump(mode="json") for voice in summaries]
+        tmp_path = self._index_path.with_name("index.json.tmp")
+        try:
+            tmp_path.write_bytes(_dumps_meta(payload))
+            os.replace(tmp_path, self._index_path)
+        except OSError:
+            # Listing falls back to the directory scan if the index cannot
+            # be persisted; never fail the mutation over it.
+            return
+        self._index_cache = None
+
+    def _refresh_index(self) -> None:
+        self._write_index(self._scan_voices())
+
     def voice_exists(self, voice_id: str) -> bool:
         if voice_id == DEFAULT_VOICE_ID:
             return True
-        return (self._voice_dir(UUID(voice_id)) / "meta.json").exists()
+        return (self._voice_dir_for_str(voice_id) / "meta.json").exists()
 
     def create_voice(
         self,
@@ -68,7 +186,8 @@ class VoiceStore:
             "description": description,
             "ref_text": ref_text,
         }
-        (voice_dir / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        (voice_dir / "meta.json").write_bytes(_dumps_meta(meta))
+        self._refresh_index()
 
         return VoiceSummary.model_validate(meta)
 
@@ -105,7 +224,8 @@ class VoiceStore:
         payload["tts_model_id"] = voice.tts_model_id
         payload["language_hint"] = voice.language_hint
         payload["description"] = voice.description
-        meta_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        meta_path.write_bytes(_dumps_meta(payload))
+        self._refresh_index()
         return voice
 
     def delete_voice(self, voice_id: UUID) -> bool:
@@ -113,23 +233,18 @@ class VoiceStore:
         if not voice_dir.exists():
             return False
         shutil.rmtree(voice_dir)
+        self._refresh_index()
         return True
 
     def _voice_dir(self, voice_id: UUID) -> Path:
         return self._voices_dir / str(voice_id)
 
+    def _voice_dir_for_str(self, voice_id: str) -> Path:
+        return self._voices_dir / _canonical_voice_dirname(voice_id)
+
     def voice_prompt_path(self, voice_id: str) -> Path:
-        return self._voice_dir(UUID(voice_id)) / "prompt.safetensors"
+        return self._voice_dir_for_str(voice_id) / "prompt.safetensors"
 
     def reference_audio_path(self, voice_id: str, suffix: str = ".wav") -> Path:
         normalized_suffix = suffix if suffix.startswith(".") else f".{suffix}"
-        return self._voice_dir(UUID(voice_id)) / f"reference_audio{normalized_suffix}"
-
-    def _default_voice_summary(self) -> VoiceSummary:
-        return VoiceSummary(
-            voice_id=DEFAULT_VOICE_ID,
-            display_name="Default Built-in Voice",
-            created_at=datetime(1970, 1, 1, tzinfo=timezone.utc),
-            tts_model_id=self._active_model_id,
-            language_hint="auto",
-        )
+        return self._voice_dir_for_str(voice_id) / f"reference_audio{normalized_suffix}"
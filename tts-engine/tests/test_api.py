@@ -1,48 +1,81 @@
 from __future__ import annotations
 
 import base64
-from pathlib import Path
-import time
+import json
+from pathlib import Path, PurePath
+import struct
+import threading
 from unittest.mock import patch
+from uuid import UUID
 
 from fastapi.testclient import TestClient
+import pytest
 
 from tts_engine.app import create_app
 from tts_engine.config import EngineConfig
 from tts_engine.constants import WS_AUTH_SUBPROTOCOL
-from tts_engine.synth import MockSynthesizer
 
 
 TOKEN = "test-token"
 
+# Binary-mode AUDIO_CHUNK frames carry a [u32 seq][u32 pcm_bytes] header.
+_WS_AUDIO_HEADER_LEN = 8
 
-def _auth_headers() -> dict[str, str]:
-    return {"Authorization": f"Bearer {TOKEN}"}
 
+_AUTH = {"Authorization": f"Bearer {TOKEN}"}
 
-def _make_client(tmp_path: Path) -> TestClient:
-    config = EngineConfig(
+# Shared dummy reference audio; cloning via wav_base64 avoids a tmp-file
+# write+read round-trip per test.
+_REF_WAV = b"RIFF....WAVEfmt "
+_REF_B64 = base64.b64encode(_REF_WAV).decode("ascii")
+
+# Speak payloads for the rate fixture, differing only in rate.
+_RATE_TEXT = "Rate control sample sentence for deterministic mock output."
+_RATE_BODIES = {
+    rate: {
+        "voice_id": "0",
+        "text": _RATE_TEXT,
+        "settings": {"rate": rate, "chunking": {"max_chars": 400}},
+    }
+    for rate in (0.5, 1.0, 2.0)
+}
+
+
+def _make_config(data_dir: Path) -> EngineConfig:
+    return EngineConfig(
         token=TOKEN,
         host="127.0.0.1",
         port=8765,
-        data_dir=tmp_path / "data",
+        data_dir=data_dir,
         synth_backend="mock",
         warmup_on_startup=False,
     )
-    return TestClient(create_app(config))
 
 
-def test_health_requires_bearer_token(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("engine") / "data"
+
+
+@pytest.fixture(scope="module")
+def client(data_dir: Path):
+    # One app per module: construction (route registration, middleware, synth
+    # init) dominates these short tests. Context-managed so the lifespan portal
+    # owns background job tasks instead of per-request portals that cancel
+    # them on response teardown. Tests only assert on resources they create,
+    # so shared voice/job state is safe.
+    with TestClient(create_app(_make_config(data_dir))) as test_client:
+        yield test_client
 
+
+def test_health_requires_bearer_token(client: TestClient) -> None:
     response = client.get("/v1/health")
     assert response.status_code == 401
     assert response.json()["error"]["code"] == "UNAUTHORIZED"
 
 
-def test_health_includes_runtime_status(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
-    response = client.get("/v1/health", headers=_auth_headers())
+def test_health_includes_runtime_status(client: TestClient) -> None:
+    response = client.get("/v1/health", headers=_AUTH)
     assert response.status_code == 200
     runtime = response.json()["runtime"]
     assert runtime["backend"] in {"qwen_custom_voice", "kyutai_pocket_tts", "mock"}
@@ -52,17 +85,27 @@ def test_health_includes_runtime_status(tmp_path: Path) -> None:
     assert runtime["warmup"]["status"] in {"not_started", "running", "ready", "error"}
 
 
-def test_clone_speak_and_stream_job(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
-    sample_wav = tmp_path / "sample.wav"
-    sample_wav.write_bytes(b"RIFF....WAVEfmt ")
+@pytest.mark.parametrize("route", ["/v1/speak", "/v1/cancel", "/v1/voices/clone"])
+@pytest.mark.parametrize("body", [b"", b"{not json"])
+def test_malformed_request_body_returns_invalid_request(
+    client: TestClient, route: str, body: bytes
+) -> None:
+    response = client.post(
+        route,
+        headers={**_AUTH, "Content-Type": "application/json"},
+        content=body,
+    )
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "INVALID_REQUEST"
+
 
+def test_clone_speak_and_stream_job(client: TestClient) -> None:
     clone_resp = client.post(
         "/v1/voices/clone",
-        headers=_auth_headers(),
+        headers=_AUTH,
         json={
             "display_name": "My Voice",
-            "ref_audio": {"path": str(sample_wav)},
+            "ref_audio": {"wav_base64": _REF_B64},
             "ref_text": "hello world",
             "language": "en",
         },
@@ -72,7 +115,7 @@ def test_clone_speak_and_stream_job(tmp_path: Path) -> None:
 
     speak_resp = client.post(
         "/v1/speak",
-        headers=_auth_headers(),
+        headers=_AUTH,
         json={
             "voice_id": voice_id,
             "text": "This is a test. It should emit at least one chunk.",
@@ -83,47 +126,54 @@ def test_clone_speak_and_stream_job(tmp_path: Path) -> None:
     assert speak_resp.status_code == 200
     job_id = speak_resp.json()["job_id"]
 
-    events = []
-    with client.websocket_connect(f"/v1/stream/{job_id}", headers=_auth_headers()) as websocket:
+    event_types = set()
+    with client.websocket_connect(
+        f"/v1/stream/{job_id}?format=binary", headers=_AUTH
+    ) as websocket:
         while True:
-            event = websocket.receive_json()
-            events.append(event)
+            message = websocket.receive()
+            frame = message.get("bytes")
+            if frame is not None:
+                # Binary mode delivers AUDIO_CHUNK as [u32 seq][u32 len] + PCM.
+                _seq, pcm_len = struct.unpack_from("<II", frame)
+                assert len(frame) == _WS_AUDIO_HEADER_LEN + pcm_len
+                event_types.add("AUDIO_CHUNK")
+                continue
+            event = json.loads(message["text"])
+            event_types.add(event["type"])
             if event["type"] in {"JOB_DONE", "JOB_CANCELED", "JOB_ERROR"}:
                 break
 
-    event_types = {event["type"] for event in events}
     assert "JOB_STARTED" in event_types
     assert "AUDIO_CHUNK" in event_types
     assert event_types.intersection({"JOB_DONE", "JOB_CANCELED", "JOB_ERROR"})
 
 
-def test_clone_with_base64_audio_persists_reference_payload(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
-    raw_audio = b"RIFF....WAVEfmt data"
+def test_clone_with_base64_audio_persists_reference_payload(client: TestClient, data_dir: Path) -> None:
     clone_resp = client.post(
         "/v1/voices/clone",
-        headers=_auth_headers(),
+        headers=_AUTH,
         json={
             "display_name": "Base64 Voice",
-            "ref_audio": {"wav_base64": base64.b64encode(raw_audio).decode("ascii")},
+            "ref_audio": {"wav_base64": _REF_B64},
             "language": "en",
         },
     )
     assert clone_resp.status_code == 200
     voice_id = clone_resp.json()["voice_id"]
-    saved_audio = tmp_path / "data" / "voices" / voice_id / "reference_audio.wav"
+    saved_audio = data_dir / "voices" / voice_id / "reference_audio.wav"
     assert saved_audio.exists()
-    assert saved_audio.read_bytes() == raw_audio
+    assert saved_audio.read_bytes() == _REF_WAV
 
 
-def test_update_and_delete_saved_voice(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
+def test_update_and_delete_saved_voice(client: TestClient, tmp_path: Path) -> None:
+    # Keeps the ref_audio path form covered; the other clone tests use base64.
     sample_wav = tmp_path / "sample.wav"
-    sample_wav.write_bytes(b"RIFF....WAVEfmt ")
+    sample_wav.write_bytes(_REF_WAV)
 
     clone_resp = client.post(
         "/v1/voices/clone",
-        headers=_auth_headers(),
+        headers=_AUTH,
         json={
             "display_name": "Original Name",
             "ref_audio": {"path": str(sample_wav)},
@@ -135,7 +185,7 @@ def test_update_and_delete_saved_voice(tmp_path: Path) -> None:
 
     patch_resp = client.patch(
         f"/v1/voices/{voice_id}",
-        headers=_auth_headers(),
+        headers=_AUTH,
         json={
             "display_name": "Updated Name",
             "language": "en-US",
@@ -149,40 +199,37 @@ def test_update_and_delete_saved_voice(tmp_path: Path) -> None:
     assert updated["language_hint"] == "en-US"
     assert updated["description"] == "My custom voice profile"
 
-    list_resp = client.get("/v1/voices", headers=_auth_headers())
+    list_resp = client.get("/v1/voices", headers=_AUTH)
     assert list_resp.status_code == 200
     updated_voice = next(voice for voice in list_resp.json()["voices"] if voice["voice_id"] == voice_id)
     assert updated_voice["display_name"] == "Updated Name"
     assert updated_voice["description"] == "My custom voice profile"
 
-    delete_resp = client.delete(f"/v1/voices/{voice_id}", headers=_auth_headers())
+    delete_resp = client.delete(f"/v1/voices/{voice_id}", headers=_AUTH)
     assert delete_resp.status_code == 200
     assert delete_resp.json()["deleted"] is True
 
-    missing_resp = client.delete(f"/v1/voices/{voice_id}", headers=_auth_headers())
+    missing_resp = client.delete(f"/v1/voices/{voice_id}", headers=_AUTH)
     assert missing_resp.status_code == 404
 
 
-def test_edit_or_delete_default_voice_is_forbidden(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
-
+def test_edit_or_delete_default_voice_is_forbidden(client: TestClient) -> None:
     patch_resp = client.patch(
         "/v1/voices/0",
-        headers=_auth_headers(),
+        headers=_AUTH,
         json={"description": "should fail"},
     )
     assert patch_resp.status_code == 403
     assert patch_resp.json()["error"]["code"] == "FORBIDDEN"
 
-    delete_resp = client.delete("/v1/voices/0", headers=_auth_headers())
+    delete_resp = client.delete("/v1/voices/0", headers=_AUTH)
     assert delete_resp.status_code == 403
     assert delete_resp.json()["error"]["code"] == "FORBIDDEN"
 
 
-def test_prefetch_models_endpoint_reports_storage_paths(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
+def test_prefetch_models_endpoint_reports_storage_paths(client: TestClient) -> None:
 
-    def _fake_download(repo_id: str, data_dir: Path) -> Path:
+    def _fake_download(repo_id: str, data_dir: Path, allow_patterns=None, max_workers=8) -> Path:
         target = data_dir / "models" / Path(*repo_id.split("/"))
         target.mkdir(parents=True, exist_ok=True)
         return target
@@ -190,7 +237,7 @@ def test_prefetch_models_endpoint_reports_storage_paths(tmp_path: Path) -> None:
     with patch("tts_engine.app.download_repo_to_local_dir", side_effect=_fake_download):
         response = client.post(
             "/v1/models/prefetch",
-            headers=_auth_headers(),
+            headers=_AUTH,
             json={"mode": "qwen_all"},
         )
 
@@ -198,40 +245,41 @@ def test_prefetch_models_endpoint_reports_storage_paths(tmp_path: Path) -> None:
     payload = response.json()
     assert payload["ok"] is True
     assert payload["mode"] == "qwen_all"
-    assert payload["data_dir"].endswith("data")
-    assert payload["models_dir"].endswith("data\\models") or payload["models_dir"].endswith("data/models")
-    assert "Qwen/Qwen3-TTS-12Hz-0.6B-CustomVoice" in payload["downloaded"]
-    assert "Qwen/Qwen3-TTS-12Hz-0.6B-Base" in payload["downloaded"]
+    assert PurePath(payload["data_dir"]).name == "data"
+    assert PurePath(payload["models_dir"]).parts[-2:] == ("data", "models")
+    downloaded = set(payload["downloaded"])
+    assert {
+        "Qwen/Qwen3-TTS-12Hz-0.6B-CustomVoice",
+        "Qwen/Qwen3-TTS-12Hz-0.6B-Base",
+    }.issubset(downloaded)
 
 
-def test_default_voice_available_and_speak_without_clone(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
+def test_default_voice_available_and_speak_without_clone(client: TestClient) -> None:
 
-    voices_resp = client.get("/v1/voices", headers=_auth_headers())
+    voices_resp = client.get("/v1/voices", headers=_AUTH)
     assert voices_resp.status_code == 200
     voices = voices_resp.json()["voices"]
     assert any(voice["voice_id"] == "0" for voice in voices)
 
     speak_resp = client.post(
         "/v1/speak",
-        headers=_auth_headers(),
+        headers=_AUTH,
         json={"text": "Test default voice path."},
     )
     assert speak_resp.status_code == 200
     job_id = speak_resp.json()["job_id"]
 
-    with client.websocket_connect(f"/v1/stream/{job_id}", headers=_auth_headers()) as websocket:
+    with client.websocket_connect(f"/v1/stream/{job_id}", headers=_AUTH) as websocket:
         while True:
             event = websocket.receive_json()
             if event["type"] in {"JOB_DONE", "JOB_CANCELED", "JOB_ERROR"}:
                 break
 
 
-def test_ws_subprotocol_auth_fallback(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
+def test_ws_subprotocol_auth_fallback(client: TestClient) -> None:
     speak_resp = client.post(
         "/v1/speak",
-        headers=_auth_headers(),
+        headers=_AUTH,
         json={"voice_id": "0", "text": "Subprotocol auth test"},
     )
     assert speak_resp.status_code == 200
@@ -246,30 +294,22 @@ def test_ws_subprotocol_auth_fallback(tmp_path: Path) -> None:
 
 
 def test_quit_endpoint_triggers_shutdown_callback(tmp_path: Path) -> None:
-    config = EngineConfig(
-        token=TOKEN,
-        host="127.0.0.1",
-        port=8765,
-        data_dir=tmp_path / "data",
-        synth_backend="mock",
-        warmup_on_startup=False,
-    )
-    app = create_app(config)
+    # Dedicated client: this test mutates app.state.request_shutdown, which
+    # must not leak into the shared module fixture.
+    app = create_app(_make_config(tmp_path / "data"))
     called = {"value": False}
     app.state.request_shutdown = lambda: called.__setitem__("value", True)
-    client = TestClient(app)
-
-    response = client.post("/v1/quit", headers=_auth_headers(), json={})
+    with TestClient(app) as client:
+        response = client.post("/v1/quit", headers=_AUTH, json={})
     assert response.status_code == 200
     assert response.json()["quitting"] is True
     assert called["value"] is True
 
 
-def test_warmup_endpoint_wait_mode(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
+def test_warmup_endpoint_wait_mode(client: TestClient) -> None:
     response = client.post(
         "/v1/warmup",
-        headers=_auth_headers(),
+        headers=_AUTH,
         json={"wait": True, "force": True, "reason": "test"},
     )
     assert response.status_code == 200
@@ -278,11 +318,10 @@ def test_warmup_endpoint_wait_mode(tmp_path: Path) -> None:
     assert payload["warmup"]["status"] in {"ready", "error"}
 
 
-def test_activate_model_triggers_warmup_and_updates_model_id(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
+def test_activate_model_triggers_warmup_and_updates_model_id(client: TestClient) -> None:
     response = client.post(
         "/v1/models/activate",
-        headers=_auth_headers(),
+        headers=_AUTH,
         json={
             "synth_backend": "mock",
             "active_model_id": "mock-model-v2",
@@ -298,23 +337,29 @@ def test_activate_model_triggers_warmup_and_updates_model_id(tmp_path: Path) ->
     assert payload["runtime"]["backend"] == "mock"
     assert payload["runtime"]["warmup"]["status"] in {"ready", "error"}
 
-    health = client.get("/v1/health", headers=_auth_headers())
+    health = client.get("/v1/health", headers=_AUTH)
     assert health.status_code == 200
     assert health.json()["active_model_id"] == "mock-model-v2"
 
 
-def test_cancel_drops_inflight_chunk_output(tmp_path: Path) -> None:
-    original_synthesize = MockSynthesizer.synthesize_chunk
+def test_cancel_drops_inflight_chunk_output(client: TestClient) -> None:
+    synthesis_started = threading.Event()
+    cancel_issued = threading.Event()
 
-    def _slow_synthesize(self: MockSynthesizer, chunk_text: str, voice_id: str, language: str | None = None):
-        time.sleep(0.25)
-        return original_synthesize(self, chunk_text, voice_id, language)
+    def _hold_chunk(chunk_text: str) -> None:
+        synthesis_started.set()
+        # Hold the chunk in flight until the cancel has been posted, instead
+        # of sleeping a fixed interval and hoping the cancel races ahead.
+        cancel_issued.wait(timeout=2.0)
 
-    with patch.object(MockSynthesizer, "synthesize_chunk", new=_slow_synthesize):
-        client = _make_client(tmp_path)
+    # The mock backend exposes an on_start hook for exactly this kind of
+    # timing control; no class monkeypatching needed.
+    synthesizer = client.app.state.synthesizer
+    synthesizer.on_start = _hold_chunk
+    try:
         speak_resp = client.post(
             "/v1/speak",
-            headers=_auth_headers(),
+            headers=_AUTH,
             json={
                 "voice_id": "0",
                 "text": "Cancel me while first chunk is synthesizing.",
@@ -324,69 +369,72 @@ def test_cancel_drops_inflight_chunk_output(tmp_path: Path) -> None:
         assert speak_resp.status_code == 200
         job_id = speak_resp.json()["job_id"]
 
-        time.sleep(0.05)
+        assert synthesis_started.wait(timeout=2.0)
         cancel_resp = client.post(
             "/v1/cancel",
-            headers=_auth_headers(),
+            headers=_AUTH,
             json={"job_id": job_id},
         )
         assert cancel_resp.status_code == 200
         assert cancel_resp.json()["canceled"] is True
 
-        events = []
-        with client.websocket_connect(f"/v1/stream/{job_id}", headers=_auth_headers()) as websocket:
-            while True:
-                event = websocket.receive_json()
-                events.append(event)
-                if event["type"] in {"JOB_DONE", "JOB_CANCELED", "JOB_ERROR"}:
-                    break
+        # Release the held chunk, then confirm via wait_terminal: the server
+        # responds with the terminal event once the job has actually stopped,
+        # replacing the old reconnect-and-drain websocket dance.
+        cancel_issued.set()
+        confirm_resp = client.post(
+            "/v1/cancel",
+            headers=_AUTH,
+            json={"job_id": job_id, "wait_terminal": True},
+        )
+        assert confirm_resp.status_code == 200
+        payload = confirm_resp.json()
+        assert payload["canceled"] is True
+        assert payload["terminal_event"]["type"] == "JOB_CANCELED"
 
-        event_types = [event["type"] for event in events]
-        assert event_types[-1] == "JOB_CANCELED"
-        assert "AUDIO_CHUNK" not in event_types
+        # The in-flight chunk was dropped: the job history holds no audio.
+        job_history = client.app.state.jobs._jobs[UUID(job_id)].history
+        assert all(event["type"] != "AUDIO_CHUNK" for event in job_history)
+    finally:
+        synthesizer.on_start = None
 
 
-def test_rate_setting_changes_output_chunk_length(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
-    text = "Rate control sample sentence for deterministic mock output."
+def _first_chunk_pcm_bytes(client: TestClient, rate: float) -> int:
+    speak_resp = client.post("/v1/speak", headers=_AUTH, json=_RATE_BODIES[rate])
+    assert speak_resp.status_code == 200
+    job_id = speak_resp.json()["job_id"]
+
+    with client.websocket_connect(
+        f"/v1/stream/{job_id}?format=binary", headers=_AUTH
+    ) as websocket:
+        while True:
+            message = websocket.receive()
+            frame = message.get("bytes")
+            if frame is not None:
+                return len(frame) - _WS_AUDIO_HEADER_LEN
+            event = json.loads(message["text"])
+            if event["type"] in {"JOB_DONE", "JOB_CANCELED", "JOB_ERROR"}:
+                raise AssertionError("No AUDIO_CHUNK received")
 
-    def _first_chunk_pcm_bytes(rate: float) -> int:
-        speak_resp = client.post(
-            "/v1/speak",
-            headers=_auth_headers(),
-            json={
-                "voice_id": "0",
-                "text": text,
-                "settings": {
-                    "rate": rate,
-                    "chunking": {"max_chars": 400},
-                },
-            },
-        )
-        assert speak_resp.status_code == 200
-        job_id = speak_resp.json()["job_id"]
 
-        with client.websocket_connect(f"/v1/stream/{job_id}", headers=_auth_headers()) as websocket:
-            while True:
-                event = websocket.receive_json()
-                if event["type"] == "AUDIO_CHUNK":
-                    return len(base64.b64decode(event["audio"]["data_base64"]))
-                if event["type"] in {"JOB_DONE", "JOB_CANCELED", "JOB_ERROR"}:
-                    raise AssertionError("No AUDIO_CHUNK received")
+@pytest.fixture(scope="module")
+def rate_chunk_lengths(client: TestClient) -> dict[float, int]:
+    # One speak + stream round-trip per rate, shared by the parametrized
+    # ordering assertions below.
+    return {rate: _first_chunk_pcm_bytes(client, rate) for rate in (0.5, 1.0, 2.0)}
 
-    normal_len = _first_chunk_pcm_bytes(rate=1.0)
-    faster_len = _first_chunk_pcm_bytes(rate=2.0)
-    slower_len = _first_chunk_pcm_bytes(rate=0.5)
 
-    assert faster_len < normal_len
-    assert slower_len > normal_len
+@pytest.mark.parametrize(("faster_rate", "slower_rate"), [(2.0, 1.0), (1.0, 0.5)])
+def test_rate_setting_changes_output_chunk_length(
+    rate_chunk_lengths: dict[float, int], faster_rate: float, slower_rate: float
+) -> None:
+    assert rate_chunk_lengths[faster_rate] < rate_chunk_lengths[slower_rate]
 
 
-def test_cancel_unknown_job_returns_404(tmp_path: Path) -> None:
-    client = _make_client(tmp_path)
+def test_cancel_unknown_job_returns_404(client: TestClient) -> None:
     response = client.post(
         "/v1/cancel",
-        headers=_auth_headers(),
+        headers=_AUTH,
         json={"job_id": "00000000-0000-0000-0000-000000000001"},
     )
     assert response.status_code == 404
@@ -2,31 +2,80 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from tts_engine.model_store import (
     QWEN_CUSTOM_MODEL_REPO,
     configure_hf_cache,
+    ensure_model_local,
     repo_id_to_local_dir,
     resolve_model_source,
 )
 
 
-def test_resolve_model_source_prefers_explicit_existing_path(tmp_path: Path) -> None:
-    model_dir = tmp_path / "my_model"
+@pytest.fixture(scope="module")
+def store_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # One temp tree per module; each test works in its own subdirectory, so
+    # the per-test mktemp (and its syscalls) happens once.
+    return tmp_path_factory.mktemp("model_store")
+
+
+def test_resolve_model_source_prefers_explicit_existing_path(store_root: Path) -> None:
+    model_dir = store_root / "explicit" / "my_model"
     model_dir.mkdir(parents=True)
-    resolved = resolve_model_source(tmp_path / "data", str(model_dir))
+    resolved = resolve_model_source(store_root / "explicit" / "data", str(model_dir))
     assert resolved == str(model_dir.resolve())
 
 
-def test_resolve_model_source_uses_local_repo_mirror_when_present(tmp_path: Path) -> None:
-    data_dir = tmp_path / "data"
+def test_resolve_model_source_uses_local_repo_mirror_when_present(store_root: Path) -> None:
+    data_dir = store_root / "mirror" / "data"
     local_repo_dir = repo_id_to_local_dir(data_dir, QWEN_CUSTOM_MODEL_REPO)
     local_repo_dir.mkdir(parents=True)
+    (local_repo_dir / ".complete").touch()
     resolved = resolve_model_source(data_dir, QWEN_CUSTOM_MODEL_REPO)
     assert resolved == str(local_repo_dir.resolve())
 
 
-def test_configure_hf_cache_defaults_to_data_dir(monkeypatch, tmp_path: Path) -> None:
+def test_resolve_model_source_ignores_incomplete_local_mirror(store_root: Path) -> None:
+    data_dir = store_root / "incomplete" / "data"
+    local_repo_dir = repo_id_to_local_dir(data_dir, QWEN_CUSTOM_MODEL_REPO)
+    local_repo_dir.mkdir(parents=True)
+    resolved = resolve_model_source(data_dir, QWEN_CUSTOM_MODEL_REPO)
+    assert resolved == QWEN_CUSTOM_MODEL_REPO
+
+
+def test_ensure_model_local_reuses_mirror_and_evicts_lru(store_root: Path) -> None:
+    data_dir = store_root / "lru" / "data"
+    hot_repo_dir = repo_id_to_local_dir(data_dir, QWEN_CUSTOM_MODEL_REPO)
+    hot_repo_dir.mkdir(parents=True)
+    (hot_repo_dir / "weights.safetensors").write_bytes(b"x" * 64)
+    (hot_repo_dir / ".complete").touch()
+
+    resolved = ensure_model_local(QWEN_CUSTOM_MODEL_REPO, data_dir)
+    assert resolved == hot_repo_dir
+    assert (hot_repo_dir / ".lru").exists()
+
+    stale_repo_dir = repo_id_to_local_dir(data_dir, "org/stale-model")
+    stale_repo_dir.mkdir(parents=True)
+    (stale_repo_dir / "weights.safetensors").write_bytes(b"x" * 64)
+    os.utime(stale_repo_dir, (0, 0))
+
+    def _fake_download(repo_id: str, data_dir_arg: Path, allow_patterns=None, max_workers=8) -> Path:
+        target = repo_id_to_local_dir(data_dir_arg, repo_id)
+        target.mkdir(parents=True, exist_ok=True)
+        return target
+
+    with patch("tts_engine.model_store.download_repo_to_local_dir", side_effect=_fake_download):
+        ensure_model_local("org/new-model", data_dir, max_cache_bytes=100)
+
+    assert not stale_repo_dir.exists()
+    assert hot_repo_dir.exists()
+    assert repo_id_to_local_dir(data_dir, "org/new-model").exists()
+
+
+def test_configure_hf_cache_defaults_to_data_dir(monkeypatch, store_root: Path) -> None:
     for env_key in (
         "VOICEREADER_HF_CACHE_DIR",
         "VOICEREADER_HF_HUB_CACHE_DIR",
@@ -37,7 +86,7 @@ def test_configure_hf_cache_defaults_to_data_dir(monkeypatch, tmp_path: Path) ->
     ):
         monkeypatch.delenv(env_key, raising=False)
 
-    data_dir = tmp_path / "data"
+    data_dir = store_root / "hfcache" / "data"
     paths = configure_hf_cache(data_dir)
 
     assert paths.cache_root == (data_dir / "hf-cache").resolve()
@@ -47,3 +96,13 @@ def test_configure_hf_cache_defaults_to_data_dir(monkeypatch, tmp_path: Path) ->
     assert os.environ["HF_HUB_CACHE"] == str(paths.hub_cache)
     assert os.environ["HUGGINGFACE_HUB_CACHE"] == str(paths.hub_cache)
     assert "TRANSFORMERS_CACHE" not in os.environ
+
+    # Reconfiguring back to an already seen data_dir is a memoization hit for
+    # the path derivation, but the env vars must still follow the active dir.
+    other_dir = store_root / "hfcache" / "other"
+    configure_hf_cache(other_dir)
+    repointed = configure_hf_cache(data_dir)
+    assert repointed == paths
+    assert os.environ["HF_HOME"] == str(paths.cache_root)
+    assert os.environ["HF_HUB_CACHE"] == str(paths.hub_cache)
+    assert os.environ["HUGGINGFACE_HUB_CACHE"] == str(paths.hub_cache)